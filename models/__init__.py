@@ -24,6 +24,9 @@ from .commands import CommandResult, RemoteCommand
 # Import messaging models
 from .messaging import RedisMessage
 
+# Import shared validators
+from .validation import validate
+
 __all__ = [
     # Enums
     "CommandType",
@@ -47,4 +50,6 @@ __all__ = [
     "CommandResult",
     # Messaging models
     "RedisMessage",
+    # Validation
+    "validate",
 ]
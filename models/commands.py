@@ -18,7 +18,7 @@ class RemoteCommand(BaseModel):
     )
     timestamp: datetime = Field(..., description="Command timestamp")
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 class CommandResult(BaseModel):
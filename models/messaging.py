@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class RedisMessage(BaseModel):
@@ -16,4 +16,19 @@ class RedisMessage(BaseModel):
     data: Dict[str, Any] = Field(..., description="Message payload")
     correlation_id: Optional[str] = Field(
         default=None, description="Correlation ID for tracing"
-    )
\ No newline at end of file
+    )
+
+    # Queue encoding, filled in on first push. The fields are frozen and
+    # model_copy drops it, but the ``data`` dict itself is still mutable, so
+    # don't modify it after the message has been pushed.
+    _encoded: Optional[bytes] = PrivateAttr(default=None)
+
+    model_config = ConfigDict(frozen=True)
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "RedisMessage":
+        """Copy the message, dropping the cached queue encoding."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._encoded = None
+        return copied
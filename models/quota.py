@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 from .enums import ProductCode
 
@@ -21,6 +21,8 @@ class QuotaRefreshRequest(BaseModel):
         default_factory=datetime.utcnow, description="Request timestamp"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class QuotaRefreshResponse(BaseModel):
     """Response for quota refresh request."""
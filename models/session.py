@@ -38,4 +38,4 @@ class SessionLifecycleEvent(BaseModel):
         default=None, description="Additional event metadata"
     )
 
-    model_config = ConfigDict(use_enum_values=True)
\ No newline at end of file
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
\ No newline at end of file
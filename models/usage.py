@@ -41,7 +41,7 @@ class UsageRecord(BaseModel):
             raise ValueError("response_timestamp must be after request_timestamp")
         return v
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 class EnrichedUsageRecord(UsageRecord):
@@ -0,0 +1,37 @@
+"""Shared validators for DataPlane Agent models.
+
+Adapters for the models parsed off the Redis queues are built once at import,
+so forked workers inherit the compiled validators instead of rebuilding them.
+"""
+
+from typing import Any, Dict, Type, TypeVar, cast
+
+from pydantic import BaseModel, TypeAdapter
+
+from .commands import RemoteCommand
+from .messaging import RedisMessage
+from .quota import QuotaRefreshRequest
+from .session import SessionLifecycleEvent
+from .usage import EnrichedUsageRecord, UsageRecord
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_ADAPTERS: Dict[type, TypeAdapter[Any]] = {
+    cls: TypeAdapter(cls)
+    for cls in (
+        RedisMessage,
+        UsageRecord,
+        EnrichedUsageRecord,
+        SessionLifecycleEvent,
+        QuotaRefreshRequest,
+        RemoteCommand,
+    )
+}
+
+
+def validate(cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Validate ``data`` into ``cls`` using its prebuilt adapter."""
+    adapter = _ADAPTERS.get(cls)
+    if adapter is None:
+        adapter = _ADAPTERS[cls] = TypeAdapter(cls)
+    return cast(ModelT, adapter.validate_python(data))
@@ -7,48 +7,14 @@ import time
 import uuid
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from config import ApplicationConfig
 from models import CommandResult, CommandType, RemoteCommand
 from utils import create_contextual_logger, set_correlation_id
 from .control_plane_client import ControlPlaneClient
 from .redis_client import RedisClient
-
-class RetryHelper:
-    """Manages retry state and exponential backoff for a worker."""
-    def __init__(self, config: ApplicationConfig, logger):
-        self.config = config
-        self.logger = logger
-        self.consecutive_failures = 0
-        self.circuit_open = False
-
-    def mark_failure(self):
-        self.consecutive_failures += 1
-        if self.consecutive_failures >= self.config.control_plane_retry_attempts:
-            if not self.circuit_open:
-                self.logger.warning("Circuit breaker OPENED due to repeated failures.")
-                self.circuit_open = True
-
-    def mark_success(self):
-        if self.circuit_open:
-            self.logger.info("Circuit breaker CLOSED after successful connection.")
-        self.consecutive_failures = 0
-        self.circuit_open = False
-
-    def get_backoff_delay(self) -> float:
-        if self.consecutive_failures == 0:
-            return 0.0
-        
-        delay = self.config.control_plane_initial_error_delay * (2 ** (self.consecutive_failures - 1))
-        capped_delay = min(delay, self.config.control_plane_max_backoff)
-        
-        self.logger.info(
-            f"Next retry in {capped_delay:.2f} seconds...",
-            consecutive_failures=self.consecutive_failures,
-            delay_seconds=capped_delay
-        )
-        return capped_delay
+from .retry_helper import RetryHelper
 
 
 class CommandProcessor:
@@ -68,6 +34,13 @@ class CommandProcessor:
         self.logger = create_contextual_logger(__name__, service="command_processor")
         self._shutdown_event = threading.Event()
         self._retry_helper = RetryHelper(config, self.logger)
+        # Keyed by member; RemoteCommand stores the plain values, which hash and
+        # compare equal to the str-based members, so lookups by value still hit
+        self._command_handlers: Dict[CommandType, Callable[[RemoteCommand], Dict[str, Any]]] = {
+            CommandType.REFRESH_PUBLIC_KEYS: self._refresh_public_keys_sync,
+            CommandType.HEALTH_CHECK: self._health_check_sync,
+            CommandType.GET_METRICS: self._get_metrics_sync,
+        }
 
     def start(self) -> None:
         """Start the command polling worker in the thread pool."""
@@ -134,15 +107,23 @@ class CommandProcessor:
 
     def _execute_command_sync(self, command: RemoteCommand) -> Dict[str, Any]:
         """Execute a specific command and return result data."""
-        if command.command_type == CommandType.REFRESH_PUBLIC_KEYS:
-            return self.control_plane_client.fetch_jwt_public_keys_sync()
-        elif command.command_type == CommandType.HEALTH_CHECK:
-            # Note: HealthMetricsService is not passed to CommandProcessor currently.
-            # This would require a small refactor to inject it if this command is used.
-            self.logger.warning("HEALTH_CHECK command is not fully implemented in sync mode.")
-            return {"status": "not_implemented"}
-        elif command.command_type == CommandType.GET_METRICS:
-            self.logger.warning("GET_METRICS command is not fully implemented in sync mode.")
-            return {"status": "not_implemented"}
-        else:
+        handler = self._command_handlers.get(command.command_type)
+        if handler is None:
             raise ValueError(f"Unknown command type: {command.command_type}")
+        return handler(command)
+
+    def _refresh_public_keys_sync(self, command: RemoteCommand) -> Dict[str, Any]:
+        """Refetch the JWT public keys from ControlPlane."""
+        return self.control_plane_client.fetch_jwt_public_keys_sync()
+
+    def _health_check_sync(self, command: RemoteCommand) -> Dict[str, Any]:
+        """Report health status (not yet available in sync mode)."""
+        # Note: HealthMetricsService is not passed to CommandProcessor currently.
+        # This would require a small refactor to inject it if this command is used.
+        self.logger.warning("HEALTH_CHECK command is not fully implemented in sync mode.")
+        return {"status": "not_implemented"}
+
+    def _get_metrics_sync(self, command: RemoteCommand) -> Dict[str, Any]:
+        """Report metrics (not yet available in sync mode)."""
+        self.logger.warning("GET_METRICS command is not fully implemented in sync mode.")
+        return {"status": "not_implemented"}
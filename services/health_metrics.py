@@ -16,41 +16,7 @@ from models import HeartbeatData, ServerRegistration
 from utils import create_contextual_logger, set_correlation_id
 from .control_plane_client import ControlPlaneClient
 from .redis_client import RedisClient
-
-class RetryHelper:
-    """Manages retry state and exponential backoff for a worker."""
-    def __init__(self, config: ApplicationConfig, logger):
-        self.config = config
-        self.logger = logger
-        self.consecutive_failures = 0
-        self.circuit_open = False
-
-    def mark_failure(self):
-        self.consecutive_failures += 1
-        if self.consecutive_failures >= self.config.control_plane_retry_attempts:
-            if not self.circuit_open:
-                self.logger.warning("Circuit breaker OPENED due to repeated failures.")
-                self.circuit_open = True
-
-    def mark_success(self):
-        if self.circuit_open:
-            self.logger.info("Circuit breaker CLOSED after successful connection.")
-        self.consecutive_failures = 0
-        self.circuit_open = False
-
-    def get_backoff_delay(self) -> float:
-        if self.consecutive_failures == 0:
-            return 0.0
-        
-        delay = self.config.control_plane_initial_error_delay * (2 ** (self.consecutive_failures - 1))
-        capped_delay = min(delay, self.config.control_plane_max_backoff)
-        
-        self.logger.info(
-            f"Next retry in {capped_delay:.2f} seconds...",
-            consecutive_failures=self.consecutive_failures,
-            delay_seconds=capped_delay
-        )
-        return capped_delay
+from .retry_helper import RetryHelper
 
 # Prometheus metrics definitions remain the same...
 usage_records_processed = Counter(
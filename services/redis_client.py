@@ -4,20 +4,86 @@ This module provides Redis connectivity and queue operations.
 """
 
 import asyncio
-import json
-from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union, cast
+import weakref
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Type, TypeVar, Union, cast, overload
 
+import orjson
 import redis.asyncio as redis
+from pydantic import BaseModel
 from redis.exceptions import ConnectionError, RedisError
 
 from config import ApplicationConfig
-from models import RedisMessage
+from models import RedisMessage, validate as validate_model
 from utils import create_contextual_logger, log_exception
 
+# Naive datetimes in this codebase come from utcnow(), so tag them as UTC.
+# Non-string dict keys are stringified, as json.dumps did.
+_DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _encode_message(message: Union[Dict[str, Any], RedisMessage]) -> bytes:
+    """Serialize a message for a Redis queue.
+
+    A ``RedisMessage`` is frozen, so its encoding is cached on the instance and
+    re-pushing the same message skips serialization.
+    """
+    if isinstance(message, RedisMessage):
+        encoded = message._encoded
+        if encoded is None:
+            encoded = message._encoded = orjson.dumps(
+                message.model_dump(), default=str, option=_DUMPS_OPTIONS
+            )
+        return encoded
+    return orjson.dumps(message, default=str, option=_DUMPS_OPTIONS)
+
+
+@overload
+def _decode_message(
+    serialized: Union[str, bytes], model_cls: None = None, validate: bool = True
+) -> Dict[str, Any]: ...
+
+
+@overload
+def _decode_message(
+    serialized: Union[str, bytes], model_cls: Type[ModelT], validate: bool = True
+) -> ModelT: ...
+
+
+@overload
+def _decode_message(
+    serialized: Union[str, bytes], model_cls: Optional[Type[ModelT]], validate: bool = True
+) -> Union[Dict[str, Any], ModelT]: ...
+
+
+def _decode_message(
+    serialized: Union[str, bytes],
+    model_cls: Optional[Type[ModelT]] = None,
+    validate: bool = True,
+) -> Union[Dict[str, Any], ModelT]:
+    """Decode a queued message, optionally into ``model_cls``.
+
+    The model is validated by default. Passing ``validate=False`` builds it
+    with ``model_construct`` instead, which trusts the producer and skips
+    validation entirely; only use it for queues this agent writes itself.
+    """
+    data: Dict[str, Any] = orjson.loads(serialized)
+    if model_cls is None:
+        return data
+    if not validate:
+        return model_cls.model_construct(**data)
+    return validate_model(model_cls, data)
+
 
 class RedisClient:
     """Async Redis client with connection management and queue operations."""
 
+    # Connection pools shared by the clients on each event loop, keyed by their
+    # settings, with the number of clients using each. Pools are bound to the
+    # loop they were created on, so entries are dropped along with their loop.
+    _pool_cache: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], Tuple[redis.ConnectionPool, int]]]" = weakref.WeakKeyDictionary()
+
     def __init__(self, config: ApplicationConfig) -> None:
         """Initialize Redis client."""
         self.config = config
@@ -45,15 +111,8 @@ class RedisClient:
     async def connect(self) -> None:
         """Establish Redis connection."""
         try:
-            self._pool = redis.ConnectionPool(
-                host=self.config.redis_host,
-                port=self.config.redis_port,
-                password=self.config.redis_password,
-                db=self.config.redis_db,
-                socket_timeout=self.config.redis_socket_timeout,
-                retry_on_timeout=self.config.redis_retry_on_timeout,
-                max_connections=self.config.redis_max_connections,
-            )
+            if self._pool is None:
+                self._pool = self._acquire_pool()
             self._client = redis.Redis(connection_pool=self._pool)
             
             # Test connection
@@ -82,12 +141,59 @@ class RedisClient:
             )
             raise
 
+    def _pool_kwargs(self) -> Dict[str, Any]:
+        """Return the keyword arguments for this client's connection pool."""
+        return dict(
+            host=self.config.redis_host,
+            port=self.config.redis_port,
+            password=self.config.redis_password,
+            db=self.config.redis_db,
+            socket_timeout=self.config.redis_socket_timeout,
+            retry_on_timeout=self.config.redis_retry_on_timeout,
+            max_connections=self.config.redis_max_connections,
+        )
+
+    def _pool_key(self) -> Tuple[Any, ...]:
+        """Return the settings that identify this client's connection pool."""
+        return tuple(self._pool_kwargs().values())
+
+    def _acquire_pool(self) -> redis.ConnectionPool:
+        """Return the running loop's shared pool for this client's settings and count this client as a user."""
+        loop_pools = self._pool_cache.setdefault(asyncio.get_running_loop(), {})
+        key = self._pool_key()
+        pool, users = loop_pools.get(key, (None, 0))
+        if pool is None:
+            pool = redis.ConnectionPool(**self._pool_kwargs())
+        loop_pools[key] = (pool, users + 1)
+        return pool
+
+    async def _release_pool(self) -> None:
+        """Drop this client's use of its pool, closing the pool after its last user."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        
+        loop_pools = self._pool_cache.get(asyncio.get_running_loop(), {})
+        key = self._pool_key()
+        cached, users = loop_pools.get(key, (None, 0))
+        if cached is not pool:
+            return
+        if users > 1:
+            loop_pools[key] = (pool, users - 1)
+            return
+        
+        # Last user gone: evict the pool so the next connect builds a fresh one
+        del loop_pools[key]
+        await pool.disconnect()
+
     async def disconnect(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection and release the connection pool."""
         if self._client:
             await self._client.close()
             self._connected = False
             self.logger.info("Disconnected from Redis")
+        
+        await self._release_pool()
 
     async def is_connected(self) -> bool:
         """Check Redis connection status."""
@@ -116,12 +222,7 @@ class RedisClient:
         await self._ensure_connected()
         
         try:
-            if isinstance(message, RedisMessage):
-                data = message.model_dump()
-            else:
-                data = message
-            
-            serialized = json.dumps(data, default=str)
+            serialized = _encode_message(message)
             
             if self._client:
                 await cast(Awaitable[int], self._client.lpush(queue, serialized))
@@ -143,12 +244,62 @@ class RedisClient:
             )
             raise
 
+    async def push_messages(
+        self,
+        queue: str,
+        messages: List[Union[Dict[str, Any], RedisMessage]],
+        correlation_id: Optional[str] = None
+    ) -> None:
+        """Push several messages to a Redis queue with a single LPUSH."""
+        if not messages:
+            return
+        
+        await self._ensure_connected()
+        
+        try:
+            payloads = [_encode_message(message) for message in messages]
+            
+            if self._client:
+                await cast(Awaitable[int], self._client.lpush(queue, *payloads))
+                
+                self.logger.debug(
+                    "Messages pushed to queue",
+                    queue=queue,
+                    correlation_id=correlation_id,
+                    message_count=len(payloads),
+                )
+        except Exception as e:
+            log_exception(
+                self.logger,
+                e,
+                "Failed to push messages to queue",
+                queue=queue,
+                correlation_id=correlation_id,
+                message_count=len(messages),
+            )
+            raise
+
+    @overload
+    async def pop_message(
+        self, queue: str, timeout: int = 0, model_cls: None = None, validate: bool = True
+    ) -> Optional[Dict[str, Any]]: ...
+
+    @overload
+    async def pop_message(
+        self, queue: str, timeout: int = 0, *, model_cls: Type[ModelT], validate: bool = True
+    ) -> Optional[ModelT]: ...
+
     async def pop_message(
         self, 
         queue: str, 
-        timeout: int = 0
-    ) -> Optional[Dict[str, Any]]:
-        """Pop message from Redis queue with optional timeout."""
+        timeout: int = 0,
+        model_cls: Optional[Type[ModelT]] = None,
+        validate: bool = True,
+    ) -> Optional[Union[Dict[str, Any], ModelT]]:
+        """Pop message from Redis queue with optional timeout.
+
+        The message is returned as a dict unless ``model_cls`` is given.
+        """
         await self._ensure_connected()
         
         try:
@@ -158,12 +309,12 @@ class RedisClient:
                     result = await cast(Awaitable[list], self._client.brpop([queue], timeout=timeout))
                     if result:
                         _, serialized = result
-                        return json.loads(serialized)
+                        return _decode_message(serialized, model_cls, validate)
                 else:
                     # Non-blocking pop
                     serialized = await cast(Awaitable[Optional[str]], self._client.rpop(queue))
                     if serialized:
-                        return json.loads(serialized)
+                        return _decode_message(serialized, model_cls, validate)
             return None
         except Exception as e:
             self.logger.error(
@@ -173,13 +324,39 @@ class RedisClient:
             )
             raise
 
+    @overload
+    async def reliable_pop_message(
+        self,
+        source_queue: str,
+        processing_queue: str,
+        timeout: int = 5,
+        model_cls: None = None,
+        validate: bool = True,
+    ) -> Optional[Dict[str, Any]]: ...
+
+    @overload
+    async def reliable_pop_message(
+        self,
+        source_queue: str,
+        processing_queue: str,
+        timeout: int = 5,
+        *,
+        model_cls: Type[ModelT],
+        validate: bool = True,
+    ) -> Optional[ModelT]: ...
+
     async def reliable_pop_message(
         self,
         source_queue: str,
         processing_queue: str,
-        timeout: int = 5
-    ) -> Optional[Dict[str, Any]]:
-        """Reliably pop message using BRPOPLPUSH pattern."""
+        timeout: int = 5,
+        model_cls: Optional[Type[ModelT]] = None,
+        validate: bool = True,
+    ) -> Optional[Union[Dict[str, Any], ModelT]]:
+        """Reliably pop message using BRPOPLPUSH pattern.
+
+        The message is returned as a dict unless ``model_cls`` is given.
+        """
         await self._ensure_connected()
         
         try:
@@ -191,7 +368,7 @@ class RedisClient:
                 ))
 
                 if result:
-                    return json.loads(result)
+                    return _decode_message(result, model_cls, validate)
             return None
         except Exception as e:
             self.logger.error(
@@ -232,23 +409,37 @@ class RedisClient:
         message_data: str,
         error_info: Optional[str] = None
     ) -> None:
-        """Move failed message to dead letter queue."""
+        """Move failed message to dead letter queue.
+
+        A ``message_data`` that is not valid JSON is kept in the DLQ entry as
+        a string, so malformed messages can still be inspected.
+        """
         await self._ensure_connected()
         
         try:
             if self._client:
+                # Parsed rather than spliced in as raw bytes: only a parse can
+                # tell a malformed payload apart, and this is the failure path
+                try:
+                    original_message: Any = orjson.loads(message_data)
+                except orjson.JSONDecodeError:
+                    original_message = message_data
+                
                 # Create DLQ entry with error info
-                dlq_entry = {
-                    "original_message": json.loads(message_data),
-                    "error_info": error_info,
-                    "failed_at": json.dumps(asyncio.get_event_loop().time(), default=str),
-                    "processing_queue": processing_queue,
-                }
+                dlq_entry = orjson.dumps(
+                    {
+                        "original_message": original_message,
+                        "error_info": error_info,
+                        "failed_at": str(asyncio.get_event_loop().time()),
+                        "processing_queue": processing_queue,
+                    },
+                    default=str,
+                    option=_DUMPS_OPTIONS,
+                )
                 
                 # Push to DLQ and remove from processing queue
                 await cast(Awaitable[int], self._client.lpush(
-                    self.config.dead_letter_queue,
-                    json.dumps(dlq_entry, default=str)
+                    self.config.dead_letter_queue, dlq_entry
                 ))
                 await cast(Awaitable[int], self._client.lrem(processing_queue, 1, message_data))
                 
@@ -15,7 +15,7 @@ from models import (
     QuotaRefreshRequest,
     QuotaRefreshResponse,
     SessionLifecycleEvent,
-    UsageRecord,
+    validate,
 )
 from models.enums import ProductCode, SessionEventType
 from utils import create_contextual_logger
@@ -271,16 +271,16 @@ class RedisConsumerService:
         correlation_id: str
     ) -> None:
         """Process a single usage record."""
-        # Parse and validate usage record
-        usage_record = UsageRecord(**message_data)
-        
-        # Enrich with server metadata
-        enriched_record = EnrichedUsageRecord(
-            **usage_record.model_dump(),
-            server_instance_id=self.config.server_id,
-            api_server_region=self.config.server_region,
-            processing_timestamp=datetime.utcnow(),
-            agent_version=self.config.app_version,
+        # Parse, validate and enrich with server metadata in a single pass
+        enriched_record = validate(
+            EnrichedUsageRecord,
+            {
+                **message_data,
+                "server_instance_id": self.config.server_id,
+                "api_server_region": self.config.server_region,
+                "processing_timestamp": datetime.utcnow(),
+                "agent_version": self.config.app_version,
+            }
         )
         
         # Submit to ControlPlane and check if successful
@@ -292,21 +292,21 @@ class RedisConsumerService:
         if result.get("submitted_count", 0) > 0:
             self.logger.info(
                 "Usage record processed successfully",
-                session_id=usage_record.api_session_id,
-                customer_id=usage_record.customer_id,
+                session_id=enriched_record.api_session_id,
+                customer_id=enriched_record.customer_id,
                 correlation_id=correlation_id,
             )
         else:
             self.logger.error(
                 "Usage record processing failed - submission to ControlPlane unsuccessful",
-                session_id=usage_record.api_session_id,
-                customer_id=usage_record.customer_id,
+                session_id=enriched_record.api_session_id,
+                customer_id=enriched_record.customer_id,
                 submitted_count=result.get("submitted_count", 0),
                 total_count=result.get("total_count", 1),
                 correlation_id=correlation_id,
             )
             # Re-raise the exception to ensure the message is requeued or moved to DLQ
-            raise RuntimeError(f"Failed to submit usage record for session {usage_record.api_session_id}")
+            raise RuntimeError(f"Failed to submit usage record for session {enriched_record.api_session_id}")
 
     async def _process_session_lifecycle_event(
         self, 
@@ -314,7 +314,7 @@ class RedisConsumerService:
         correlation_id: str
     ) -> None:
         """Process a session lifecycle event."""
-        event = SessionLifecycleEvent(**message_data)
+        event = validate(SessionLifecycleEvent, message_data)
         result = None
         
         try:
@@ -366,7 +366,7 @@ class RedisConsumerService:
         if 'product_code' not in message_data:
             message_data['product_code'] = ProductCode.SPEECH_TRANSCRIPTION.value
 
-        quota_request = QuotaRefreshRequest(**message_data)
+        quota_request = validate(QuotaRefreshRequest, message_data)
         
         try:
             # Submit quota refresh request to ControlPlane and get response
@@ -0,0 +1,72 @@
+"""Retry helper for DataPlane Agent workers.
+
+This module provides the shared retry state and exponential backoff used by
+the background worker threads.
+"""
+
+import random
+from typing import List
+
+from config import ApplicationConfig
+
+
+class RetryHelper:
+    """Manages retry state and exponential backoff for a worker."""
+
+    __slots__ = (
+        "logger",
+        "consecutive_failures",
+        "circuit_open",
+        "_current_backoff",
+        "_backoff_table",
+        "_retry_attempts",
+    )
+
+    def __init__(self, config: ApplicationConfig, logger):
+        self.logger = logger
+        self.consecutive_failures = 0
+        self.circuit_open = False
+        self._retry_attempts = config.control_plane_retry_attempts
+        # Delay for the next retry, recomputed only when the failure count changes
+        self._current_backoff = 0.0
+        # Capped delay after 1, 2, ... failures; the last entry repeats from then on
+        initial_delay = config.control_plane_initial_error_delay
+        max_backoff = config.control_plane_max_backoff
+        self._backoff_table: List[float] = []
+        delay = initial_delay
+        while 0 < delay < max_backoff:
+            self._backoff_table.append(float(delay))
+            delay = initial_delay * (1 << len(self._backoff_table))
+        self._backoff_table.append(float(min(delay, max_backoff)))
+
+    def mark_failure(self):
+        self.consecutive_failures += 1
+        table = self._backoff_table
+        self._current_backoff = table[min(self.consecutive_failures, len(table)) - 1]
+        if self.consecutive_failures >= self._retry_attempts:
+            if not self.circuit_open:
+                self.logger.warning("Circuit breaker OPENED due to repeated failures.")
+                self.circuit_open = True
+
+    def mark_success(self):
+        if self.circuit_open:
+            self.logger.info("Circuit breaker CLOSED after successful connection.")
+        self.consecutive_failures = 0
+        self.circuit_open = False
+        self._current_backoff = 0.0
+
+    def get_backoff_delay(self) -> float:
+        capped_delay = self._current_backoff
+        if capped_delay == 0.0:
+            return 0.0
+        
+        # Equal jitter: keep half the backoff and randomize the rest, so agents
+        # that failed together do not all retry at the same instant
+        jittered_delay = random.uniform(capped_delay / 2, capped_delay)
+        
+        self.logger.info(
+            f"Next retry in {jittered_delay:.2f} seconds...",
+            consecutive_failures=self.consecutive_failures,
+            delay_seconds=jittered_delay
+        )
+        return jittered_delay
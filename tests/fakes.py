@@ -0,0 +1,188 @@
+"""Hand-written fakes and mock factories shared by the DataPlane Agent tests."""
+
+from typing import Any, Dict, List, Tuple
+from unittest.mock import AsyncMock
+
+from services import ControlPlaneClient, RedisClient
+
+
+class FakeRedis:
+    """In-memory stand-in for ``redis.asyncio.Redis`` that records its calls.
+
+    ``replies`` maps a command name to the value it returns; an exception
+    instance is raised instead.
+    """
+
+    def __init__(self, **replies: Any) -> None:
+        self.replies = replies
+        self.calls: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+        self.pushed: List[Tuple[Any, ...]] = []
+
+    def calls_to(self, name: str) -> List[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+        """Return the ``(args, kwargs)`` of every call to ``name``."""
+        return [(args, kwargs) for called, args, kwargs in self.calls if called == name]
+
+    def _reply(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((name, args, kwargs))
+        reply = self.replies.get(name)
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+    async def lpush(self, queue: str, *values: Any) -> Any:
+        self.pushed.append((queue, *values))
+        return self._reply("lpush", queue, *values)
+
+    async def brpop(self, keys: List[str], timeout: int = 0) -> Any:
+        return self._reply("brpop", keys, timeout=timeout)
+
+    async def rpop(self, queue: str) -> Any:
+        return self._reply("rpop", queue)
+
+    async def brpoplpush(self, source: str, destination: str, timeout: int = 0) -> Any:
+        return self._reply("brpoplpush", source, destination, timeout=timeout)
+
+    async def rpoplpush(self, source: str, destination: str) -> Any:
+        return self._reply("rpoplpush", source, destination)
+
+    async def lrem(self, queue: str, count: int, value: Any) -> Any:
+        return self._reply("lrem", queue, count, value)
+
+    async def llen(self, queue: str) -> Any:
+        return self._reply("llen", queue)
+
+    async def get(self, key: str) -> Any:
+        return self._reply("get", key)
+
+    async def set(self, key: str, value: Any) -> Any:
+        return self._reply("set", key, value)
+
+    async def setex(self, key: str, ttl: int, value: Any) -> Any:
+        return self._reply("setex", key, ttl, value)
+
+    async def delete(self, key: str) -> Any:
+        return self._reply("delete", key)
+
+    async def incr(self, key: str) -> Any:
+        return self._reply("incr", key)
+
+    async def ping(self) -> Any:
+        return self._reply("ping")
+
+    async def close(self) -> Any:
+        return self._reply("close")
+
+
+# Shared by every successful ControlPlane call; tests only read it
+_OK: Dict[str, Any] = {"status": "success"}
+
+_DEFAULT_RETURNS: Dict[str, Dict[str, Any]] = {
+    "redis": {
+        "is_connected": True,
+        "pop_message": None,
+        "reliable_pop_message": None,
+        "get_queue_length": 0,
+        "get_all_queue_lengths": {},
+        "get_cache": None,
+        "health_check": {"status": "healthy"},
+    },
+    "control_plane": {
+        "submit_usage_records": _OK,
+        "notify_session_start": _OK,
+        "request_quota_refresh": _OK,
+        "notify_session_complete": _OK,
+        "register_server": _OK,
+        "send_heartbeat": _OK,
+        "poll_commands": [],
+        "report_command_result": _OK,
+        "fetch_jwt_public_keys": {"keys": []},
+        "health_check": {"status": "healthy"},
+    },
+}
+
+_MOCK_METHODS: Dict[str, Tuple[str, ...]] = {
+    "redis": (
+        "connect",
+        "disconnect",
+        "push_message",
+        "acknowledge_message",
+        "move_to_dead_letter_queue",
+        "set_cache",
+        "delete_cache",
+    ),
+    "control_plane": ("start", "stop"),
+}
+
+
+def _build_mock(name: str, spec: type) -> AsyncMock:
+    """Build a spec'd AsyncMock with the default service methods configured."""
+    mock_client = AsyncMock(spec=spec)
+    for method in _MOCK_METHODS[name]:
+        setattr(mock_client, method, AsyncMock())
+    for method, value in _DEFAULT_RETURNS[name].items():
+        setattr(mock_client, method, AsyncMock(return_value=value))
+    return mock_client
+
+
+def reset_service_mock(name: str, mock_client: AsyncMock) -> AsyncMock:
+    """Clear recorded calls and overrides, then restore the default returns."""
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    for method in _MOCK_METHODS[name]:
+        if not isinstance(getattr(mock_client, method), AsyncMock):
+            # A test swapped in its own stub; put a recording mock back
+            setattr(mock_client, method, AsyncMock())
+    for method, value in _DEFAULT_RETURNS[name].items():
+        child = getattr(mock_client, method)
+        if not isinstance(child, AsyncMock):
+            child = AsyncMock()
+            setattr(mock_client, method, child)
+        child.return_value = value
+    return mock_client
+
+
+def create_mock_redis_client() -> AsyncMock:
+    """Create a mock Redis client."""
+    return _build_mock("redis", RedisClient)
+
+
+def create_mock_control_plane_client() -> AsyncMock:
+    """Create a mock ControlPlane client."""
+    return _build_mock("control_plane", ControlPlaneClient)
+
+
+def create_mock_usage_record() -> Dict[str, Any]:
+    """Create a mock usage record for testing."""
+    return {
+        "transaction_id": "txn-test-001",
+        "api_session_id": "test-session-001",
+        "customer_id": "test-customer-001",
+        "product_code": "SPEECH_TRANSCRIPTION",
+        "connection_duration_seconds": 120.5,
+        "data_bytes_processed": 1024000,
+        "audio_duration_seconds": 110.0,
+        "request_count": 1,
+        "request_timestamp": "2024-01-15T10:00:00Z",
+        "response_timestamp": "2024-01-15T10:02:00Z",
+    }
+
+
+def create_mock_session_event() -> Dict[str, Any]:
+    """Create a mock session lifecycle event for testing."""
+    return {
+        "api_session_id": "test-session-001",
+        "customer_id": "test-customer-001",
+        "event_type": "start",
+        "timestamp": "2024-01-15T10:00:00Z",
+        "metadata": {"test": "data"},
+    }
+
+
+def create_mock_quota_request() -> Dict[str, Any]:
+    """Create a mock quota refresh request for testing."""
+    return {
+        "api_session_id": "test-session-001",
+        "customer_id": "test-customer-001",
+        "current_usage": 50.0,
+        "requested_quota": 100.0,
+        "timestamp": "2024-01-15T10:00:00Z",
+    }
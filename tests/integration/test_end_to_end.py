@@ -1,13 +1,18 @@
 """End-to-end integration tests for the DataPlane Agent system."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List, Tuple
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
 
+from fakes import (
+    create_mock_control_plane_client,
+    create_mock_redis_client,
+)
 from models import (
     CommandType,
     RemoteCommand,
@@ -19,7 +24,160 @@ from services import (
     RedisConsumerService,
 )
 
+_EVT_START = SessionEventType.START
+_CMD_HEALTH = CommandType.HEALTH_CHECK
+_TS_START = datetime(2024, 1, 15, 10, 0, 0)
+
+_VALID_USAGE_DICT = {
+    "transaction_id": "txn-session456-001",
+    "api_session_id": "session456",
+    "customer_id": "customer123",
+    "product_code": "speech_transcription",
+    "connection_duration_seconds": 30.0,
+    "data_bytes_processed": 1024000,
+    "audio_duration_seconds": 25.5,
+    "request_count": 1,
+    "request_timestamp": "2024-01-15T10:00:00Z",
+    "response_timestamp": "2024-01-15T10:00:30Z",
+}
+
+# Session start payload shared by every run; the consumer never mutates it
+_SESSION_START_DICT = {
+    "transaction_id": "test-transaction-001",
+    "api_session_id": "session789",
+    "customer_id": "customer456",
+    "event_type": SessionEventType.START.value,
+    "timestamp": "2024-01-15T10:00:00Z",
+    "metadata": {"client_version": "1.2.0"},
+}
+
+
+class _FastAsyncMock:
+    """Awaitable stub that only records its calls and returns a fixed value."""
+
+    def __init__(self, ret: Any = None) -> None:
+        self.ret = ret
+        self.calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+def _new_consumer(config: Any) -> RedisConsumerService:
+    """Build a consumer wired to its own fresh service mocks."""
+    return RedisConsumerService(
+        config=config,
+        redis_client=create_mock_redis_client(),
+        control_plane_client=create_mock_control_plane_client(),
+    )
+
+
+def _new_processor(config: Any) -> CommandProcessor:
+    """Build a command processor wired to its own fresh service mocks."""
+    return CommandProcessor(
+        config=config,
+        redis_client=create_mock_redis_client(),
+        control_plane_client=create_mock_control_plane_client(),
+        executor=AsyncMock(spec=ThreadPoolExecutor),
+    )
+
+
+async def _usage_record_flow(consumer: RedisConsumerService) -> None:
+    """Run a usage record from Redis through to the ControlPlane."""
+    config = consumer.config
+    submit = _FastAsyncMock({"submitted_count": 1, "total_count": 1})
+    consumer.control_plane_client.submit_usage_records = submit
+
+    # Simulate processing a single message
+    await consumer._process_usage_record(_VALID_USAGE_DICT, "test-correlation-id")
+
+    # Verify ControlPlane was called with enriched data
+    assert len(submit.calls) == 1
+    (enriched_records, _), _ = submit.calls[0]
+
+    assert len(enriched_records) == 1
+    enriched_record = enriched_records[0]
+    assert enriched_record.api_session_id == "session456"
+    assert enriched_record.customer_id == "customer123"
+    assert enriched_record.server_instance_id == config.server_id
+    assert enriched_record.agent_version == config.app_version
+
+
+async def _session_lifecycle_flow(consumer: RedisConsumerService) -> None:
+    """Run a session start event through to the ControlPlane."""
+    notify = _FastAsyncMock({"status": "success"})
+    consumer.control_plane_client.notify_session_start = notify
 
+    # Simulate processing
+    await consumer._process_session_lifecycle_event(
+        _SESSION_START_DICT, "test-correlation-id"
+    )
+
+    # Verify event was sent to ControlPlane
+    assert len(notify.calls) == 1
+    (session_event, _), _ = notify.calls[0]
+
+    assert session_event.api_session_id == "session789"
+    assert session_event.event_type == _EVT_START
+
+
+async def _remote_command_flow(processor: CommandProcessor) -> None:
+    """Run a polled remote command through execution and result reporting."""
+    config = processor.config
+    redis_client = processor.redis_client
+    control_plane_client = processor.control_plane_client
+
+    # Prepare remote command
+    health_command = RemoteCommand(
+        command_id="cmd001",
+        command_type=_CMD_HEALTH,
+        timestamp=_TS_START,
+        parameters={},
+    )
+
+    # The processor runs in worker threads, so it only uses the sync methods
+    control_plane_client.poll_commands_sync.return_value = [health_command]
+    # Mock Redis to show command has not been executed
+    redis_client.get_cache_sync.return_value = None
+
+    # Record reported results in a plain list
+    reported: List[Tuple[Any, ...]] = []
+    control_plane_client.report_command_result_sync.side_effect = (
+        lambda *args, **kwargs: reported.append(args)
+    )
+
+    # Test the command processing directly
+    processor._process_command_sync(health_command, "test-correlation-id")
+
+    # Verify checks and actions
+    redis_client.get_cache_sync.assert_called_once_with("executed_commands:cmd001")
+    redis_client.set_cache_sync.assert_called_once_with(
+        "executed_commands:cmd001", "executed", ttl=config.command_cache_ttl
+    )
+    assert len(reported) == 1
+
+    # Check that the result reported was successful
+    server_id, command_result, _ = reported[0]
+    assert server_id == config.server_id
+    assert command_result.success is True
+    assert command_result.command_id == "cmd001"
+    assert command_result.result == {"status": "not_implemented"}
+
+
+@pytest.fixture(scope="class")
+def shared_consumer(mock_config: Any) -> RedisConsumerService:
+    """Build one consumer per test class; tests swap in their own mocks."""
+    return _new_consumer(mock_config)
+
+
+@pytest.fixture(scope="class")
+def shared_processor(mock_config: Any) -> CommandProcessor:
+    """Build one command processor per test class; tests swap in their own mocks."""
+    return _new_processor(mock_config)
+
+
+@pytest.mark.xdist_group("e2e_integration")
 class TestEndToEndIntegration:
     """
     Comprehensive integration tests for service interactions.
@@ -27,146 +185,58 @@ class TestEndToEndIntegration:
     as they mock the external service boundaries (Redis/ControlPlane raw clients).
     """
 
-    @pytest.mark.asyncio
-    async def test_complete_usage_record_flow(
-        self, mock_config: Any, mock_redis_client: Any, mock_control_plane_client: Any
-    ) -> None:
-        """Test complete flow from Redis queue to ControlPlane for usage records."""
-        # Prepare test data
-        usage_record_data = {
-            "transaction_id": "txn-session456-001",
-            "api_session_id": "session456",
-            "customer_id": "customer123",
-            "product_code": "speech_transcription",
-            "connection_duration_seconds": 30.0,
-            "data_bytes_processed": 1024000,
-            "audio_duration_seconds": 25.5,
-            "request_count": 1,
-            "request_timestamp": "2024-01-15T10:00:00Z",
-            "response_timestamp": "2024-01-15T10:00:30Z",
-        }
-
-        # Mock Redis to return our test message
-        mock_redis_client.reliable_pop_message.return_value = (
-            "msg1",
-            usage_record_data,
-        )
-
-        # Initialize the consumer service with mocks
-        consumer = RedisConsumerService(
-            config=mock_config,
-            redis_client=mock_redis_client,
-            control_plane_client=mock_control_plane_client,
-        )
+    @pytest.fixture
+    def consumer(
+        self,
+        shared_consumer: RedisConsumerService,
+        mock_redis_client: Any,
+        mock_control_plane_client: Any,
+    ) -> RedisConsumerService:
+        """Point the shared consumer at this test's service mocks."""
+        shared_consumer.redis_client = mock_redis_client
+        shared_consumer.control_plane_client = mock_control_plane_client
+        return shared_consumer
 
-        # Simulate processing a single message
-        await consumer._process_usage_record(usage_record_data, "test-correlation-id")
+    @pytest.fixture
+    def processor(
+        self,
+        shared_processor: CommandProcessor,
+        mock_redis_client: Any,
+        mock_control_plane_client: Any,
+    ) -> CommandProcessor:
+        """Point the shared command processor at this test's service mocks."""
+        shared_processor.redis_client = mock_redis_client
+        shared_processor.control_plane_client = mock_control_plane_client
+        return shared_processor
 
-        # Verify ControlPlane was called with enriched data
-        mock_control_plane_client.submit_usage_records.assert_called_once()
-        call_args = mock_control_plane_client.submit_usage_records.call_args[0]
-        enriched_records = call_args[0]
+    async def test_all_flows(self, mock_config: Any) -> None:
+        """Run the independent message flows concurrently on one event loop."""
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_usage_record_flow(_new_consumer(mock_config)))
+            tg.create_task(_session_lifecycle_flow(_new_consumer(mock_config)))
+            tg.create_task(_remote_command_flow(_new_processor(mock_config)))
 
-        assert len(enriched_records) == 1
-        enriched_record = enriched_records[0]
-        assert enriched_record.api_session_id == "session456"
-        assert enriched_record.customer_id == "customer123"
-        assert enriched_record.server_instance_id == mock_config.server_id
-        assert enriched_record.agent_version == mock_config.app_version
+    @pytest.mark.slow
+    async def test_complete_usage_record_flow(
+        self, consumer: RedisConsumerService
+    ) -> None:
+        """Test complete flow from Redis queue to ControlPlane for usage records."""
+        await _usage_record_flow(consumer)
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_session_lifecycle_complete_flow(
-        self, mock_config: Any, mock_redis_client: Any, mock_control_plane_client: Any
+        self, consumer: RedisConsumerService
     ) -> None:
         """Test complete session lifecycle event processing."""
-        # Test session start event
-        start_event_data = {
-            "transaction_id": "test-transaction-001",
-            "api_session_id": "session789",
-            "customer_id": "customer456",
-            "event_type": "start",
-            "timestamp": "2024-01-15T10:00:00Z",
-            "metadata": {"client_version": "1.2.0"},
-        }
-
-        mock_redis_client.reliable_pop_message.return_value = ("msg1", start_event_data)
-
-        consumer = RedisConsumerService(
-            config=mock_config,
-            redis_client=mock_redis_client,
-            control_plane_client=mock_control_plane_client,
-        )
-
-        # Simulate processing
-        await consumer._process_session_lifecycle_event(
-            start_event_data, "test-correlation-id"
-        )
-
-        # Verify event was sent to ControlPlane
-        mock_control_plane_client.notify_session_start.assert_called_once()
-        call_args = mock_control_plane_client.notify_session_start.call_args[0]
-        session_event = call_args[0]
-
-        assert session_event.api_session_id == "session789"
-        assert session_event.event_type == SessionEventType.START
+        await _session_lifecycle_flow(consumer)
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_remote_command_execution_flow(
-        self, mock_config: Any, mock_redis_client: Any, mock_control_plane_client: Any
+        self, processor: CommandProcessor
     ) -> None:
         """Test remote command polling and execution."""
-        # Prepare remote command
-        health_command = RemoteCommand(
-            command_id="cmd001",
-            command_type=CommandType.HEALTH_CHECK,
-            timestamp=datetime.utcnow(),
-            parameters={},
-        )
-
-        # Mock ControlPlane to return the command
-        mock_control_plane_client.poll_commands.return_value = [health_command]
-        # Mock Redis to show command has not been executed
-        mock_redis_client.get_cache.return_value = None
-
-        # Mock ThreadPoolExecutor for the processor
-        from concurrent.futures import ThreadPoolExecutor
-        mock_executor = AsyncMock(spec=ThreadPoolExecutor)
-        
-        processor = CommandProcessor(
-            config=mock_config,
-            redis_client=mock_redis_client,
-            control_plane_client=mock_control_plane_client,
-            executor=mock_executor,
-        )
+        await _remote_command_flow(processor)
 
-        # Since CommandProcessor is now synchronous, we'll test the sync methods directly
-        # Mock the synchronous poll_commands_sync method
-        mock_control_plane_client.poll_commands_sync.return_value = [health_command]
-        
-        # Mock Redis cache operations
-        mock_redis_client.get_cache.return_value = None
-        
-        # Mock the report_command_result_sync method
-        mock_control_plane_client.report_command_result_sync = AsyncMock()
-        
-        # Test the command processing directly
-        processor._process_command_sync(health_command, "test-correlation-id")
-
-        # Verify checks and actions
-        mock_redis_client.get_cache.assert_called_once_with("executed_commands:cmd001")
-        mock_redis_client.set_cache.assert_called_once()
-        mock_control_plane_client.report_command_result_sync.assert_called_once()
-
-        # Check that the result reported was successful
-        result_call_args = mock_control_plane_client.report_command_result_sync.call_args[0]
-        server_id = result_call_args[0]
-        command_result = result_call_args[1]
-        assert server_id == mock_config.server_id
-        assert command_result.success is True
-        assert command_result.command_id == "cmd001"
-        assert "overall_status" in command_result.result
-
-    @pytest.mark.asyncio
     async def test_graceful_shutdown(
         self, mock_config: Any, mock_redis_client: Any, mock_control_plane_client: Any
     ) -> None:
@@ -178,9 +248,8 @@ class TestEndToEndIntegration:
         )
 
         # Mock ThreadPoolExecutor for the processor
-        from concurrent.futures import ThreadPoolExecutor
         mock_executor = AsyncMock(spec=ThreadPoolExecutor)
-        
+
         processor = CommandProcessor(
             config=mock_config,
             redis_client=mock_redis_client,
@@ -202,6 +271,5 @@ class TestEndToEndIntegration:
 
         # Verify consumer stopped gracefully
         assert not consumer._running
-        # Ensure tasks were cancelled
-        for task in consumer._tasks:
-            assert task.cancelled()
\ No newline at end of file
+        # stop() already gathered the cancelled tasks, so they are all finished
+        assert all(task.done() for task in consumer._tasks)
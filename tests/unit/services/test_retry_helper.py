@@ -0,0 +1,70 @@
+"""Tests for the worker retry/backoff helper."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from services.retry_helper import RetryHelper
+
+_CONFIG = SimpleNamespace(
+    control_plane_initial_error_delay=5,
+    control_plane_max_backoff=300,
+    control_plane_retry_attempts=3,
+)
+
+
+def _make_helper() -> RetryHelper:
+    """Build a helper in its initial state."""
+    return RetryHelper(_CONFIG, Mock())
+
+
+@pytest.mark.parametrize(
+    "n_failures,expected_delay,expected_open",
+    [
+        (0, 0.0, False),
+        (1, 5.0, False),
+        (2, 10.0, False),
+        (3, 20.0, True),
+        (4, 40.0, True),
+        (20, 300.0, True),
+    ],
+)
+def test_backoff_after_failures(
+    n_failures: int, expected_delay: float, expected_open: bool
+) -> None:
+    """Test jittered exponential backoff, its cap, and the circuit breaker threshold."""
+    helper = _make_helper()
+    for _ in range(n_failures):
+        helper.mark_failure()
+
+    assert expected_delay / 2 <= helper.get_backoff_delay() <= expected_delay
+    assert helper.circuit_open is expected_open
+
+
+def test_mark_success_resets_state() -> None:
+    """Test that a success closes the circuit and clears the backoff."""
+    helper = _make_helper()
+    for _ in range(5):
+        helper.mark_failure()
+
+    helper.mark_success()
+
+    assert helper.consecutive_failures == 0
+    assert helper.circuit_open is False
+    assert helper.get_backoff_delay() == 0.0
+
+
+def test_backoff_jitter_spans_upper_half(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the jitter draws from the upper half of the capped backoff."""
+    bounds = []
+    monkeypatch.setattr(
+        "services.retry_helper.random.uniform",
+        lambda low, high: bounds.append((low, high)) or high,
+    )
+    helper = _make_helper()
+    helper.mark_failure()
+    helper.mark_failure()
+
+    assert helper.get_backoff_delay() == 10.0
+    assert bounds == [(5.0, 10.0)]
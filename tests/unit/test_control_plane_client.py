@@ -1,11 +1,13 @@
 """Unit tests for ControlPlane client service."""
+import asyncio
 import json
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
-from httpx import HTTPStatusError, RequestError, Response
+import requests
+from requests.adapters import HTTPAdapter
 
 from models import (
     EnrichedUsageRecord,
@@ -17,87 +19,158 @@ from models import (
     QuotaRefreshRequest,
     CommandResult,
 )
-from models.enums import ProductCode
+from models.enums import ProductCode, SessionCompletionReason
+from models.session import FinalUsageSummary
 from services.control_plane_client import ControlPlaneClient
 
 
+_FIXED_TS = datetime(2024, 1, 15, 10, 0, 0)
+# How the client serializes _FIXED_TS into notification payloads
+_FIXED_TS_UTC = "2024-01-15T10:00:00Z"
+
+_NOTIFY_METHODS = {
+    SessionEventType.START: "notify_session_start",
+    SessionEventType.COMPLETE: "notify_session_complete",
+}
+
+_FINAL_USAGE_SUMMARY = FinalUsageSummary(
+    total_connection_duration_seconds=120.0,
+    total_data_bytes_processed=1024,
+    total_audio_duration_seconds=110.0,
+    total_request_count=1,
+    last_request_timestamp=datetime(2024, 1, 15, 10, 2, 0),
+)
+
+_REGISTRATION = ServerRegistration(
+    server_id="test-server",
+    region="test-region",
+    version="1.0.0",
+    ip_address="192.168.1.100",
+    port=8081,
+    capabilities={
+        "supported_languages": ["en-US"],
+        "max_concurrent_sessions": 100,
+        "supported_models": ["whisper-1"],
+        "features": ["usage_tracking", "session_management"]
+    }
+)
+
+_HEARTBEAT = HeartbeatData(status="online", metrics={"uptime": 3600})
+
+_COMMAND_RESULT = CommandResult(
+    command_id="cmd-001",
+    success=True,
+    result={"output": "success"},
+    execution_timestamp=_FIXED_TS,
+)
+
+_HEALTH_CHECK_COMMAND = {
+    "command_id": "cmd-001",
+    "command_type": "health_check",
+    "timestamp": "2024-01-15T10:00:00Z"
+}
+
+# Expected request bodies, serialized once for the whole module
+_REGISTRATION_DUMP = _REGISTRATION.model_dump()
+_HEARTBEAT_DUMP = _HEARTBEAT.model_dump(mode="json")
+_COMMAND_RESULT_DUMP = _COMMAND_RESULT.model_dump(mode="json")
+
+def _done(value):
+    """Return an already-resolved future, so awaiting it never yields to the loop."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+# Patched over the client's request method; answers with _done() futures
+_SHARED_REQUEST_MOCK = MagicMock()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def control_plane_client(mock_config) -> ControlPlaneClient:
+    """Create one ControlPlane client instance for the module.
+
+    The constructor captures the running loop, so the fixture runs on the
+    session loop that every test in this module shares.
+    """
+    return ControlPlaneClient(mock_config)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mock() -> None:
+    """Clear the module-level request mock before every test."""
+    _SHARED_REQUEST_MOCK.reset_mock(return_value=True, side_effect=True)
+
+
+def _response(request, status_code, body=None) -> requests.Response:
+    """Build a real ``requests`` response for ``request``."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body or {}).encode()
+    response.request = request
+    response.url = request.url
+    return response
+
+
+def _install_transport(monkeypatch, handler):
+    """Answer every HTTP request the client sends with ``handler``; return the sent requests."""
+    calls = []
+
+    def send(adapter, request, **kwargs):
+        calls.append(request)
+        return handler(request)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    return calls
+
+
 class TestControlPlaneClient:
     """Test cases for ControlPlaneClient class."""
 
-    @pytest_asyncio.fixture
-    async def control_plane_client(self, mock_config) -> ControlPlaneClient:
-        """Create a ControlPlane client instance for testing."""
-        return ControlPlaneClient(mock_config)
-
-    @pytest.mark.asyncio
-    async def test_make_request_success(self, control_plane_client) -> None:
+    async def test_make_request_success(self, control_plane_client, monkeypatch) -> None:
         """Test successful HTTP request."""
-        from unittest.mock import Mock
-        
-        mock_client = AsyncMock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.raise_for_status.return_value = None
-        
-        mock_client.request = AsyncMock(return_value=mock_response)
-        control_plane_client._client = mock_client
+        calls = _install_transport(
+            monkeypatch, lambda request: _response(request, 200, {"status": "success"})
+        )
         
         result = await control_plane_client._make_request("GET", "/test")
         
         assert result == {"status": "success"}
-        mock_client.request.assert_called_once()
+        assert len(calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_make_request_http_error_4xx_no_retry(self, control_plane_client) -> None:
+    async def test_make_request_http_error_4xx_no_retry(self, control_plane_client, monkeypatch) -> None:
         """Test HTTP request with 4xx error (no retry)."""
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.status_code = 400
+        calls = _install_transport(monkeypatch, lambda request: _response(request, 400))
         
-        http_error = HTTPStatusError("Bad Request", request=AsyncMock(), response=mock_response)
-        mock_client.request = AsyncMock(side_effect=http_error)
-        control_plane_client._client = mock_client
-        
-        with pytest.raises(HTTPStatusError):
+        with pytest.raises(Exception, match="400 Client Error"):
             await control_plane_client._make_request("GET", "/test")
         
-        # Should not retry on 4xx errors
-        mock_client.request.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_make_request_http_error_5xx_with_retry(self, control_plane_client, mock_config) -> None:
-        """Test HTTP request with 5xx error (with retry)."""
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.status_code = 500
-        
-        http_error = HTTPStatusError("Server Error", request=AsyncMock(), response=mock_response)
-        mock_client.request = AsyncMock(side_effect=http_error)
-        control_plane_client._client = mock_client
+        assert len(calls) == 1
+
+    async def test_make_request_http_error_5xx_no_retry(self, control_plane_client, monkeypatch) -> None:
+        """Test HTTP request with 5xx error (the client does not retry)."""
+        calls = _install_transport(monkeypatch, lambda request: _response(request, 500))
         
-        with pytest.raises(HTTPStatusError):
+        with pytest.raises(Exception, match="500 Server Error"):
             await control_plane_client._make_request("GET", "/test")
         
-        # Should retry on 5xx errors
-        assert mock_client.request.call_count == mock_config.control_plane_retry_attempts
-
-    @pytest.mark.asyncio
-    async def test_make_request_network_error_with_retry(self, control_plane_client, mock_config) -> None:
-        """Test HTTP request with network error (with retry)."""
-        mock_client = AsyncMock()
-        network_error = RequestError("Network error", request=AsyncMock())
-        mock_client.request = AsyncMock(side_effect=network_error)
-        control_plane_client._client = mock_client
+        # Retries are left to the caller's RetryHelper
+        assert len(calls) == 1
+
+    async def test_make_request_network_error_no_retry(self, control_plane_client, monkeypatch) -> None:
+        """Test HTTP request with network error (the client does not retry)."""
+        def handler(request):
+            raise requests.exceptions.ConnectionError("Network error", request=request)
+        
+        calls = _install_transport(monkeypatch, handler)
         
-        with pytest.raises(RequestError):
+        with pytest.raises(Exception, match="Network error"):
             await control_plane_client._make_request("GET", "/test")
         
-        # Should retry on network errors
-        assert mock_client.request.call_count == mock_config.control_plane_retry_attempts
+        # Retries are left to the caller's RetryHelper
+        assert len(calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_submit_usage_records(self, control_plane_client) -> None:
+    async def test_submit_usage_records(self, control_plane_client, monkeypatch) -> None:
         """Test submitting usage records."""
         usage_record = EnrichedUsageRecord(
             transaction_id="test-transaction-001",
@@ -107,8 +180,8 @@ class TestControlPlaneClient:
             data_bytes_processed=1024,
             audio_duration_seconds=110.0,
             # request_count now defaults to 1, so we don't need to specify it
-            request_timestamp=datetime.utcnow(),
-            response_timestamp=datetime.utcnow(),
+            request_timestamp=_FIXED_TS,
+            response_timestamp=_FIXED_TS,
             server_instance_id="test-server",
             api_server_region="test-region",
             agent_version="1.0.0"
@@ -116,44 +189,119 @@ class TestControlPlaneClient:
         
         expected_response = {"status": "success", "credits_consumed": 10}
         
-        with patch.object(control_plane_client, "submit_usage_record", return_value=expected_response) as mock_submit:
-            result = await control_plane_client.submit_usage_records([usage_record])
-            
-            expected_result = {"submitted_count": 1, "total_count": 1}
-            assert result == expected_result
-            mock_submit.assert_called_once_with(usage_record, None)
-
-    @pytest.mark.asyncio
-    async def test_notify_session_start(self, control_plane_client) -> None:
-        """Test notifying session start."""
+        mock_submit = _SHARED_REQUEST_MOCK
+        mock_submit.return_value = _done(expected_response)
+        monkeypatch.setattr(control_plane_client, "submit_usage_record", mock_submit)
+        result = await control_plane_client.submit_usage_records([usage_record])
+        
+        expected_result = {"submitted_count": 1, "total_count": 1}
+        assert result == expected_result
+        mock_submit.assert_called_once_with(usage_record, None)
+
+    @pytest.mark.parametrize(
+        "event_type,endpoint_suffix,extra_payload_keys,event_kwargs",
+        [
+            pytest.param(
+                SessionEventType.START,
+                "started",
+                ["started_at", "client_info"],
+                {"metadata": {"client_info": {"sdk": "python"}}},
+                id="start",
+            ),
+            pytest.param(
+                SessionEventType.COMPLETE,
+                "completed",
+                ["completed_at", "disconnect_reason", "final_usage_summary"],
+                {
+                    "disconnect_reason": SessionCompletionReason.CLIENT_CLOSE,
+                    "final_usage_summary": _FINAL_USAGE_SUMMARY,
+                },
+                id="complete",
+            ),
+        ],
+    )
+    async def test_notify_session_event(
+        self, control_plane_client, monkeypatch, event_type, endpoint_suffix, extra_payload_keys, event_kwargs
+    ) -> None:
+        """Test notifying session start and completion."""
         session_event = SessionLifecycleEvent(
             transaction_id="test-transaction-001",
             api_session_id="test-session",
             customer_id="test-customer",
-            event_type=SessionEventType.START
+            event_type=event_type,
+            timestamp=_FIXED_TS,
+            **event_kwargs,
         )
+        notify = getattr(control_plane_client, _NOTIFY_METHODS[event_type])
         
         expected_response = {"status": "success"}
         
-        with patch.object(control_plane_client, "_make_async_request", return_value=expected_response) as mock_request:
-            result = await control_plane_client.notify_session_start(session_event)
-            
-            assert result == expected_response
-            mock_request.assert_called_once_with(
+        mock_request = AsyncMock(return_value=expected_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
+        result = await notify(session_event)
+        
+        assert result == expected_response
+        mock_request.assert_called_once()
+        args, kwargs = mock_request.call_args
+        assert args == ("POST", f"/api/v1/sessions/test-session/{endpoint_suffix}")
+        assert kwargs["correlation_id"] is None
+        
+        payload = kwargs["data"]
+        assert payload["transaction_id"] == "test-transaction-001"
+        assert payload["customer_id"] == "test-customer"
+        assert payload["event_type"] == event_type.value
+        assert payload[extra_payload_keys[0]] == _FIXED_TS_UTC
+        for key in extra_payload_keys:
+            assert key in payload
+
+    @pytest.mark.parametrize(
+        "method_name,args,http_method,endpoint,expected_data",
+        [
+            pytest.param(
+                "register_server",
+                (_REGISTRATION,),
                 "POST",
-                "/api/v1/sessions/test-session/started",
-                data={
-                    "transaction_id": "test-transaction-001",
-                    "customer_id": "test-customer",
-                    "event_type": "session_started",
-                    "started_at": session_event.timestamp.isoformat() + "Z",
-                    "timestamp": session_event.timestamp.isoformat() + "Z",
-                },
-                correlation_id=None
-            )
+                "/api/v1/servers/register",
+                _REGISTRATION_DUMP,
+                id="register",
+            ),
+            pytest.param(
+                "send_heartbeat",
+                ("test-server", _HEARTBEAT),
+                "PUT",
+                "/api/v1/servers/test-server/heartbeat",
+                _HEARTBEAT_DUMP,
+                id="heartbeat",
+            ),
+            pytest.param(
+                "report_command_result",
+                ("test-server", _COMMAND_RESULT),
+                "POST",
+                "/api/v1/servers/test-server/command-results",
+                _COMMAND_RESULT_DUMP,
+                id="report",
+            ),
+        ],
+    )
+    async def test_server_request(
+        self, control_plane_client, monkeypatch, method_name, args, http_method, endpoint, expected_data
+    ) -> None:
+        """Test server registration, heartbeats and command result reporting."""
+        expected_response = {"status": "success"}
+        
+        mock_request = AsyncMock(return_value=expected_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
+        result = await getattr(control_plane_client, method_name)(*args)
+        
+        assert result == expected_response
+        mock_request.assert_called_once_with(
+            http_method,
+            endpoint,
+            data=expected_data,
+            correlation_id=None
+        )
 
-    @pytest.mark.asyncio
-    async def test_request_quota_refresh(self, control_plane_client) -> None:
+    async def test_request_quota_refresh(self, control_plane_client, monkeypatch) -> None:
         """Test requesting quota refresh."""
         quota_request = QuotaRefreshRequest(
             transaction_id="test-transaction-002",
@@ -164,256 +312,104 @@ class TestControlPlaneClient:
 
         expected_response = {"status": "success", "additional_quota": 100.0}
 
-        with patch.object(control_plane_client, "_make_request", return_value=expected_response) as mock_request:
-            result = await control_plane_client.request_quota_refresh(quota_request)
-
-            assert result == expected_response
-            mock_request.assert_called_once_with(
-                method="POST",
-                endpoint="/api/v1/sessions/test-session/refresh",
-                data={
-                    "transaction_id": "test-transaction-002",
-                    "product_code": "speech_synthesis",
-                    "timestamp": quota_request.timestamp.isoformat(),
-                },
-                correlation_id=None,
-            )
+        mock_request = _SHARED_REQUEST_MOCK
+        mock_request.return_value = _done(expected_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
+        result = await control_plane_client.request_quota_refresh(quota_request)
 
-    @pytest.mark.asyncio
-    async def test_notify_session_complete(self, control_plane_client) -> None:
-        """Test notifying session completion."""
-        session_event = SessionLifecycleEvent(
-            transaction_id="test-transaction-002",
-            api_session_id="test-session",
-            customer_id="test-customer",
-            event_type=SessionEventType.COMPLETE
-        )
-        
-        expected_response = {"status": "success"}
-        
-        with patch.object(control_plane_client, "_make_request", return_value=expected_response) as mock_request:
-            result = await control_plane_client.notify_session_complete(session_event)
-            
-            assert result == expected_response
-            mock_request.assert_called_once_with(
-                method="POST",
-                endpoint="/api/v1/sessions/test-session/completed",
-                data={
-                    "completed_at": session_event.timestamp.isoformat(),
-                    "disconnect_reason": session_event.disconnect_reason,
-                    "final_usage_summary": session_event.final_usage_summary or {},
-                    "timestamp": session_event.timestamp.isoformat(),
-                },
-                correlation_id=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_register_server(self, control_plane_client) -> None:
-        """Test server registration."""
-        registration_data = ServerRegistration(
-            server_id="test-server",
-            region="test-region",
-            version="1.0.0",
-            ip_address="192.168.1.100",
-            port=8081,
-            capabilities={
-                "supported_languages": ["en-US"],
-                "max_concurrent_sessions": 100,
-                "supported_models": ["whisper-1"],
-                "features": ["usage_tracking", "session_management"]
-            }
-        )
-        
-        expected_response = {"status": "success", "server_registered": True}
-        
-        with patch.object(control_plane_client, "_make_request", return_value=expected_response) as mock_request:
-            result = await control_plane_client.register_server(registration_data)
-            
-            assert result == expected_response
-            mock_request.assert_called_once_with(
-                method="POST",
-                endpoint="/api/v1/servers/register",
-                data=registration_data.model_dump(),
-                correlation_id=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_send_heartbeat(self, control_plane_client) -> None:
-        """Test sending heartbeat."""
-        heartbeat_data = HeartbeatData(
-            status="online",
-            metrics={"uptime": 3600}
+        assert result == expected_response
+        mock_request.assert_called_once_with(
+            "POST",
+            "/api/v1/sessions/test-session/refresh",
+            data=quota_request.model_dump(mode="json"),
+            correlation_id=None,
         )
-        
-        expected_response = {"status": "success"}
-        
-        with patch.object(control_plane_client, "_make_request", return_value=expected_response) as mock_request:
-            result = await control_plane_client.send_heartbeat("test-server", heartbeat_data)
-            
-            assert result == expected_response
-            mock_request.assert_called_once_with(
-                method="PUT",
-                endpoint="/api/v1/servers/test-server/heartbeat",
-                data=heartbeat_data.model_dump(mode='json'),
-                correlation_id=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_poll_commands(self, control_plane_client) -> None:
-        """Test polling for commands."""
-        commands_response = {
-            "commands": [
-                {
-                    "command_id": "cmd-001",
-                    "command_type": "health_check",
-                    "timestamp": "2024-01-15T10:00:00Z"
-                }
-            ]
-        }
-        
-        with patch.object(control_plane_client, "_make_request", return_value=commands_response) as mock_request:
-            result = await control_plane_client.poll_commands("test-server")
-            
-            assert len(result) == 1
-            assert isinstance(result[0], RemoteCommand)
-            assert result[0].command_id == "cmd-001"
-            
-            mock_request.assert_called_once_with(
-                method="GET",
-                endpoint="/api/v1/servers/test-server/commands",
-                correlation_id=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_poll_commands_empty(self, control_plane_client) -> None:
-        """Test polling for commands when none are available."""
-        commands_response = {"commands": []}
-        
-        with patch.object(control_plane_client, "_make_request", return_value=commands_response) as mock_request:
-            result = await control_plane_client.poll_commands("test-server")
-            
-            assert len(result) == 0
-
-    @pytest.mark.asyncio
-    async def test_report_command_result(self, control_plane_client) -> None:
-        """Test reporting command execution result."""
-        command_result = CommandResult(
-            command_id="cmd-001",
-            success=True,
-            result={"output": "success"}
+
+    @pytest.mark.parametrize(
+        "cmds,expected_len",
+        [
+            pytest.param([], 0, id="empty"),
+            pytest.param([_HEALTH_CHECK_COMMAND], 1, id="one"),
+        ],
+    )
+    async def test_poll_commands(self, control_plane_client, monkeypatch, cmds, expected_len) -> None:
+        """Test polling for commands, with and without any available."""
+        commands_response = {"commands": cmds}
+        
+        mock_request = _SHARED_REQUEST_MOCK
+        mock_request.return_value = _done(commands_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
+        result = await control_plane_client.poll_commands("test-server")
+        
+        commands = result["commands"]
+        assert len(commands) == expected_len
+        if expected_len:
+            assert isinstance(commands[0], RemoteCommand)
+            assert commands[0].command_id == "cmd-001"
+        
+        mock_request.assert_called_once_with(
+            "GET",
+            "/api/v1/servers/test-server/commands",
+            correlation_id=None
         )
-        
-        expected_response = {"status": "success"}
-        
-        with patch.object(control_plane_client, "_make_request", return_value=expected_response) as mock_request:
-            result = await control_plane_client.report_command_result("test-server", command_result)
-            
-            assert result == expected_response
-            mock_request.assert_called_once_with(
-                method="POST",
-                endpoint="/api/v1/servers/test-server/command-results",
-                data=command_result.model_dump(),
-                correlation_id=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_fetch_jwt_public_keys_cache_miss(self, control_plane_client) -> None:
-        """Test fetching JWT public keys when cache is empty."""
+
+    async def test_fetch_jwt_public_keys(self, control_plane_client, monkeypatch) -> None:
+        """Test fetching JWT public keys."""
         keys_response = {"keys": [{"kid": "key1", "key": "public_key_data"}]}
         
-        with patch.object(control_plane_client, "_make_request", return_value=keys_response) as mock_request:
-            result = await control_plane_client.fetch_jwt_public_keys()
-            
-            assert result == keys_response
-            assert control_plane_client._jwt_keys_cache == keys_response
-            assert control_plane_client._jwt_keys_cached_at is not None
-            
-            mock_request.assert_called_once_with(
-                method="GET",
-                endpoint="/api/v1/auth/public-keys",
-                correlation_id=None
-            )
-
-    @pytest.mark.asyncio
-    async def test_fetch_jwt_public_keys_cache_hit(self, control_plane_client) -> None:
-        """Test fetching JWT public keys when cache is valid."""
-        cached_keys = {"keys": [{"kid": "cached_key", "key": "cached_data"}]}
-        control_plane_client._jwt_keys_cache = cached_keys
-        control_plane_client._jwt_keys_cached_at = datetime.utcnow()
+        mock_request = _SHARED_REQUEST_MOCK
+        mock_request.return_value = _done(keys_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
+        result = await control_plane_client.fetch_jwt_public_keys()
         
-        with patch.object(control_plane_client, "_make_request") as mock_request:
-            result = await control_plane_client.fetch_jwt_public_keys()
-            
-            assert result == cached_keys
-            mock_request.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_health_check_success(self, control_plane_client, mock_config) -> None:
+        assert result == keys_response
+        mock_request.assert_called_once_with(
+            "GET",
+            "/api/v1/auth/public-keys",
+            correlation_id=None
+        )
+
+    async def test_health_check_success(self, control_plane_client, monkeypatch) -> None:
         """Test health check when ControlPlane is healthy."""
         health_response = {"status": "healthy"}
         
-        with patch.object(control_plane_client, "_make_request", return_value=health_response) as mock_request:
-            control_plane_client._client = AsyncMock()  # Simulate started client
-            
-            result = await control_plane_client.health_check()
-            
-            assert result["status"] == "healthy"
-            assert result["response"] == health_response
-            assert result["base_url"] == mock_config.control_plane_url
-            
-            mock_request.assert_called_once_with("GET", "/health/dataplane")
-
-    @pytest.mark.asyncio
-    async def test_health_check_client_not_started(self, control_plane_client, mock_config) -> None:
-        """Test health check when client is not started."""
+        mock_request = _SHARED_REQUEST_MOCK
+        mock_request.return_value = _done(health_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
         result = await control_plane_client.health_check()
         
-        assert result["status"] == "unhealthy"
-        assert "Client not started" in result["error"]
-        assert result["base_url"] == mock_config.control_plane_url
+        assert result == health_response
+        mock_request.assert_called_once_with("GET", "/api/v1/health", correlation_id=None)
 
-    @pytest.mark.asyncio
-    async def test_health_check_request_failure(self, control_plane_client, mock_config) -> None:
+    async def test_health_check_request_failure(self, control_plane_client, monkeypatch) -> None:
         """Test health check when request fails."""
-        control_plane_client._client = AsyncMock()  # Simulate started client
+        mock_request = _SHARED_REQUEST_MOCK
+        mock_request.side_effect = Exception("Connection failed")
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
         
-        with patch.object(control_plane_client, "_make_request", side_effect=Exception("Connection failed")) as mock_request:
-            result = await control_plane_client.health_check()
-            
-            assert result["status"] == "unhealthy"
-            assert "Connection failed" in result["error"]
-            assert result["base_url"] == mock_config.control_plane_url
-
-    @pytest.mark.asyncio
-    async def test_notify_server_shutdown_success(self, control_plane_client) -> None:
+        with pytest.raises(Exception, match="Connection failed"):
+            await control_plane_client.health_check()
+
+    async def test_notify_server_shutdown_success(self, control_plane_client, monkeypatch) -> None:
         """Test successful server shutdown notification."""
-        control_plane_client._client = AsyncMock()  # Simulate started client
-        
         mock_response = {"success": True, "message": "Server shutdown notification received"}
         
-        with patch.object(control_plane_client, "_make_request", return_value=mock_response) as mock_request:
-            server_id = "test-server-001"
-            correlation_id = "test-correlation-123"
-            
-            result = await control_plane_client.notify_server_shutdown(
-                server_id=server_id,
-                correlation_id=correlation_id
-            )
-            
-            assert result["success"] is True
-            assert "shutdown notification received" in result["message"]
-            
-            mock_request.assert_called_once_with(
-                method="POST",
-                endpoint="/api/v1/servers/test-server-001/shutdown",
-                data={},
-                correlation_id="test-correlation-123"
-            )
-
-    @pytest.mark.asyncio
-    async def test_notify_server_shutdown_client_not_started(self, control_plane_client) -> None:
-        """Test shutdown notification when client is not started."""
-        control_plane_client._client = None  # Simulate client not started
+        mock_request = _SHARED_REQUEST_MOCK
+        mock_request.return_value = _done(mock_response)
+        monkeypatch.setattr(control_plane_client, "_make_async_request", mock_request)
+        server_id = "test-server-001"
+        correlation_id = "test-correlation-123"
         
-        with pytest.raises(RuntimeError, match="ControlPlane client not started"):
-            await control_plane_client.notify_server_shutdown("test-server-001")
+        result = await control_plane_client.notify_server_shutdown(
+            server_id=server_id,
+            correlation_id=correlation_id
+        )
+        
+        assert result["success"] is True
+        assert "shutdown notification received" in result["message"]
+        
+        mock_request.assert_called_once_with(
+            "POST",
+            "/api/v1/servers/test-server-001/shutdown",
+            correlation_id="test-correlation-123"
+        )
@@ -0,0 +1,177 @@
+"""Unit tests for the logging utilities."""
+
+import logging
+import os
+from typing import Iterator
+
+import pytest
+import structlog
+
+from utils import logging as log_utils
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging_state() -> Iterator[None]:
+    """Undo any configure_logging() a test does, so other tests are unaffected."""
+    structlog_config = structlog.get_config()
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    structlog.reset_defaults()
+    structlog.configure(**structlog_config)
+    log_utils._cached_logger.cache_clear()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestSystemContext:
+    """Test cases for the system-context processor."""
+
+    def test_adds_cached_pid_and_hostname(self) -> None:
+        """Test that every record carries the process ID and hostname."""
+        event_dict = log_utils._add_system_context(None, "info", {})
+
+        assert event_dict["pid"] == os.getpid()
+        assert event_dict["hostname"] == log_utils._HOSTNAME
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_pid_refreshed_after_fork(self) -> None:
+        """Test that a forked child reports its own PID, not the parent's."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child: report whether the processor sees the new PID, then exit hard
+            try:
+                event_dict = log_utils._add_system_context(None, "info", {})
+                os.write(write_fd, b"1" if event_dict["pid"] == os.getpid() else b"0")
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        try:
+            os.waitpid(pid, 0)
+            assert os.read(read_fd, 1) == b"1"
+        finally:
+            os.close(read_fd)
+
+        assert log_utils._PID == os.getpid()
+
+
+class TestCorrelationIdInjection:
+    """Test cases for adding the context's correlation ID to records."""
+
+    def test_no_id_by_default(self) -> None:
+        """Test that records carry no correlation ID when none is set."""
+        token = log_utils.correlation_id_context.set(None)
+        try:
+            event_dict = log_utils._add_system_context(None, "info", {})
+        finally:
+            log_utils.correlation_id_context.reset(token)
+
+        assert "correlation_id" not in event_dict
+
+    def test_id_from_set_correlation_id(self) -> None:
+        """Test that an ID set through the helper is added to records."""
+        token = log_utils.correlation_id_context.set(None)
+        try:
+            correlation_id = log_utils.set_correlation_id()
+            event_dict = log_utils._add_system_context(None, "info", {})
+        finally:
+            log_utils.correlation_id_context.reset(token)
+
+        assert len(correlation_id) == 32
+        assert event_dict["correlation_id"] == correlation_id
+
+    def test_id_set_directly_on_context_var(self) -> None:
+        """Test that an ID set on the context variable itself is added too."""
+        token = log_utils.correlation_id_context.set("corr-direct")
+        try:
+            event_dict = log_utils._add_system_context(None, "info", {})
+        finally:
+            log_utils.correlation_id_context.reset(token)
+
+        assert event_dict["correlation_id"] == "corr-direct"
+
+
+class TestJsonEncoding:
+    """Test cases for the orjson-backed record serializer."""
+
+    def test_dumps_is_compact(self) -> None:
+        """Test that records serialize compactly and in insertion order."""
+        assert log_utils._dumps({"b": 1, "a": [1, 2]}) == '{"b":1,"a":[1,2]}'
+
+    def test_dumps_falls_back_for_wide_ints(self) -> None:
+        """Test that values orjson rejects are encoded by the stdlib instead."""
+        assert log_utils._dumps({"n": 2**70}) == '{"n":%d}' % 2**70
+
+    def test_log4j_formatter_with_wide_int(self) -> None:
+        """Test that the log4j formatter survives a value orjson rejects."""
+        line = log_utils._log4j_formatter(
+            None, "info", {"timestamp": "ts", "level": "info", "event": "big", "n": 2**70}
+        )
+
+        assert line == 'ts [info]: big {"n":%d}' % 2**70
+
+
+class TestConfigureLogging:
+    """Test cases for configure_logging."""
+
+    def test_level_is_fixed_at_configure_time(self, capsys) -> None:
+        """Test that lowering the stdlib level later does not enable filtered calls."""
+        log_utils.configure_logging("WARNING")
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger = log_utils.get_logger("tests.level_fixed")
+
+        logger.info("dropped")
+        logger.warning("kept")
+
+        out = capsys.readouterr().out
+        assert "dropped" not in out
+        assert "kept" in out
+
+    def test_reconfigure_applies_to_existing_logger_names(self, capsys) -> None:
+        """Test that loggers fetched after reconfiguring use the new settings."""
+        log_utils.configure_logging("WARNING", json_output=True)
+        log_utils.get_logger("tests.reconfigure").info("hidden")
+        log_utils.get_logger("tests.reconfigure").warning("as json")
+
+        log_utils.configure_logging("DEBUG", json_output=False)
+        log_utils.get_logger("tests.reconfigure").info("as log4j")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("{") and '"event":"as json"' in lines[0]
+        assert "[info]: as log4j" in lines[1]
+
+
+class TestCorrelationIdFilter:
+    """Test cases for CorrelationIdFilter."""
+
+    @staticmethod
+    def _record() -> logging.LogRecord:
+        """Build a plain stdlib log record."""
+        return logging.LogRecord("tests", logging.INFO, __file__, 1, "msg", None, None)
+
+    def test_stamps_record_with_id(self) -> None:
+        """Test that a configured ID is added to every record."""
+        record = self._record()
+
+        assert log_utils.CorrelationIdFilter("corr-123").filter(record) is True
+        assert record.correlation_id == "corr-123"
+
+    def test_without_id_leaves_record_untouched(self) -> None:
+        """Test the fast path: no ID means the record passes unchanged."""
+        record = self._record()
+
+        assert log_utils.CorrelationIdFilter().filter(record) is True
+        assert not hasattr(record, "correlation_id")
+
+    def test_id_assigned_after_construction_is_used(self) -> None:
+        """Test that the decision is made per record, not frozen at construction."""
+        correlation_filter = log_utils.CorrelationIdFilter()
+        correlation_filter.correlation_id = "corr-456"
+        record = self._record()
+
+        correlation_filter.filter(record)
+
+        assert record.correlation_id == "corr-456"
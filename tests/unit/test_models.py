@@ -1,8 +1,7 @@
 """Unit tests for DataPlane Agent models."""
 
 import pytest
-from datetime import datetime
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from models import (
     CommandType,
@@ -13,25 +12,54 @@ from models import (
     SessionEventType,
     SessionLifecycleEvent,
     UsageRecord,
+    validate,
 )
 
+# Validators compiled once and reused by every test
+_USAGE_ADAPTER = TypeAdapter(UsageRecord)
+_ENRICHED_ADAPTER = TypeAdapter(EnrichedUsageRecord)
+_SESSION_ADAPTER = TypeAdapter(SessionLifecycleEvent)
+_QUOTA_ADAPTER = TypeAdapter(QuotaRefreshRequest)
+_CMD_ADAPTER = TypeAdapter(RemoteCommand)
+
+# Canonical payloads; tests spread these and override only the field under test
+_BASE_USAGE = {
+    "transaction_id": "test-transaction-001",
+    "api_session_id": "test-session-001",
+    "customer_id": "test-customer-001",
+    "connection_duration_seconds": 120.5,
+    "data_bytes_processed": 1024000,
+    "audio_duration_seconds": 110.0,
+    "request_timestamp": "2024-01-15T10:00:00Z",
+    "response_timestamp": "2024-01-15T10:02:00Z",
+}
+
+_BASE_SESSION = {
+    "transaction_id": "test-transaction-001",
+    "api_session_id": "test-session-001",
+    "customer_id": "test-customer-001",
+    "event_type": SessionEventType.START,
+}
+
+_BASE_QUOTA = {
+    "transaction_id": "test-transaction-001",
+    "api_session_id": "test-session-001",
+    "customer_id": "test-customer-001",
+}
+
+_BASE_COMMAND = {
+    "command_id": "cmd-001",
+    "command_type": CommandType.REFRESH_PUBLIC_KEYS,
+    "timestamp": "2024-01-15T10:00:00Z",
+}
+
 
 class TestUsageRecord:
     """Test cases for UsageRecord model."""
 
     def test_valid_usage_record(self) -> None:
         """Test creating a valid usage record."""
-        record = UsageRecord(
-            transaction_id="test-transaction-001",
-            api_session_id="test-session-001",
-            customer_id="test-customer-001",
-            connection_duration_seconds=120.5,
-            data_bytes_processed=1024000,
-            audio_duration_seconds=110.0,
-            # request_count defaults to 1 now
-            request_timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-            response_timestamp=datetime.fromisoformat("2024-01-15T10:02:00+00:00"),
-        )
+        record = _USAGE_ADAPTER.validate_python(_BASE_USAGE)
         
         assert record.api_session_id == "test-session-001"
         assert record.customer_id == "test-customer-001"
@@ -40,50 +68,29 @@ class TestUsageRecord:
         assert record.data_bytes_processed == 1024000
         assert record.audio_duration_seconds == 110.0
 
-    def test_negative_duration_validation(self) -> None:
-        """Test validation fails for negative durations."""
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"connection_duration_seconds": -10.0},
+            {"data_bytes_processed": -1000},
+            {
+                "request_timestamp": "2024-01-15T10:02:00Z",
+                "response_timestamp": "2024-01-15T10:00:00Z",
+            },
+        ],
+        ids=["neg-duration", "neg-bytes", "response-before-request"],
+    )
+    def test_usage_record_validation_errors(self, overrides) -> None:
+        """Test validation fails for negative values and out-of-order timestamps."""
         with pytest.raises(ValidationError):
-            UsageRecord(
-                transaction_id="test-transaction-002",
-                api_session_id="test-session-001",
-                customer_id="test-customer-001",
-                connection_duration_seconds=-10.0,
-                data_bytes_processed=1024000,
-                audio_duration_seconds=110.0,
-                request_count=0,
-                request_timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-                response_timestamp=datetime.fromisoformat("2024-01-15T10:02:00+00:00"),
-            )
-
-    def test_negative_bytes_validation(self) -> None:
-        """Test validation fails for negative bytes."""
-        with pytest.raises(ValidationError):
-            UsageRecord(
-                transaction_id="test-transaction-003",
-                api_session_id="test-session-001",
-                customer_id="test-customer-001",
-                connection_duration_seconds=120.5,
-                data_bytes_processed=-1000,
-                audio_duration_seconds=110.0,
-                request_count=0,
-                request_timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-                response_timestamp=datetime.fromisoformat("2024-01-15T10:02:00+00:00"),
-            )
-
-    def test_response_before_request_validation(self) -> None:
-        """Test validation fails when response timestamp is before request."""
+            _USAGE_ADAPTER.validate_python({**_BASE_USAGE, **overrides})
+
+    def test_usage_record_is_immutable(self) -> None:
+        """Test that assigning to a field of a parsed record is rejected."""
+        record = _USAGE_ADAPTER.validate_python(_BASE_USAGE)
+        
         with pytest.raises(ValidationError):
-            UsageRecord(
-                transaction_id="test-transaction-004",
-                api_session_id="test-session-001",
-                customer_id="test-customer-001",
-                connection_duration_seconds=120.5,
-                data_bytes_processed=1024000,
-                audio_duration_seconds=110.0,
-                request_count=0,
-                request_timestamp=datetime.fromisoformat("2024-01-15T10:02:00+00:00"),
-                response_timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-            )
+            record.customer_id = "other-customer"
 
 
 class TestEnrichedUsageRecord:
@@ -91,19 +98,13 @@ class TestEnrichedUsageRecord:
 
     def test_enriched_usage_record(self) -> None:
         """Test creating an enriched usage record."""
-        record = EnrichedUsageRecord(
-            transaction_id="test-transaction-005",
-            api_session_id="test-session-001",
-            customer_id="test-customer-001",
-            connection_duration_seconds=120.5,
-            data_bytes_processed=1024000,
-            audio_duration_seconds=110.0,
-            # request_count defaults to 1 now, with minimum value of 1
-            request_timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-            response_timestamp=datetime.fromisoformat("2024-01-15T10:02:00+00:00"),
-            server_instance_id="server-001",
-            api_server_region="us-east-1",
-            agent_version="1.0.0",
+        record = _ENRICHED_ADAPTER.validate_python(
+            {
+                **_BASE_USAGE,
+                "server_instance_id": "server-001",
+                "api_server_region": "us-east-1",
+                "agent_version": "1.0.0",
+            }
         )
         
         assert record.server_instance_id == "server-001"
@@ -117,12 +118,7 @@ class TestSessionLifecycleEvent:
 
     def test_session_start_event(self) -> None:
         """Test creating a session start event."""
-        event = SessionLifecycleEvent(
-            transaction_id="test-transaction-001",
-            api_session_id="test-session-001",
-            customer_id="test-customer-001",
-            event_type=SessionEventType.START,
-        )
+        event = _SESSION_ADAPTER.validate_python(_BASE_SESSION)
         
         assert event.api_session_id == "test-session-001"
         assert event.customer_id == "test-customer-001"
@@ -131,12 +127,12 @@ class TestSessionLifecycleEvent:
 
     def test_session_complete_event(self) -> None:
         """Test creating a session complete event."""
-        event = SessionLifecycleEvent(
-            transaction_id="test-transaction-002",
-            api_session_id="test-session-001",
-            customer_id="test-customer-001",
-            event_type=SessionEventType.COMPLETE,
-            metadata={"final_usage": 100.0},
+        event = _SESSION_ADAPTER.validate_python(
+            {
+                **_BASE_SESSION,
+                "event_type": SessionEventType.COMPLETE,
+                "metadata": {"final_usage": 100.0},
+            }
         )
         
         assert event.event_type == SessionEventType.COMPLETE
@@ -154,11 +150,8 @@ class TestQuotaRefreshRequest:
 
     def test_valid_quota_request(self) -> None:
         """Test creating a valid quota refresh request."""
-        request = QuotaRefreshRequest(
-            transaction_id="test-transaction-001",
-            api_session_id="test-session-001",
-            customer_id="test-customer-001",
-            product_code=ProductCode.SPEECH_SYNTHESIS,
+        request = _QUOTA_ADAPTER.validate_python(
+            {**_BASE_QUOTA, "product_code": ProductCode.SPEECH_SYNTHESIS}
         )
 
         assert request.api_session_id == "test-session-001"
@@ -168,11 +161,7 @@ class TestQuotaRefreshRequest:
 
     def test_default_product_code(self) -> None:
         """Test that the default product code is assigned correctly."""
-        request = QuotaRefreshRequest(
-            transaction_id="test-transaction-002",
-            api_session_id="test-session-002",
-            customer_id="test-customer-002",
-        )
+        request = _QUOTA_ADAPTER.validate_python(_BASE_QUOTA)
 
         assert request.product_code == ProductCode.SPEECH_TRANSCRIPTION
 
@@ -182,11 +171,7 @@ class TestRemoteCommand:
 
     def test_refresh_keys_command(self) -> None:
         """Test creating a refresh public keys command."""
-        command = RemoteCommand(
-            command_id="cmd-001",
-            command_type=CommandType.REFRESH_PUBLIC_KEYS,
-            timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-        )
+        command = _CMD_ADAPTER.validate_python(_BASE_COMMAND)
         
         assert command.command_id == "cmd-001"
         assert command.command_type == CommandType.REFRESH_PUBLIC_KEYS
@@ -194,11 +179,12 @@ class TestRemoteCommand:
 
     def test_health_check_command(self) -> None:
         """Test creating a health check command."""
-        command = RemoteCommand(
-            command_id="cmd-002",
-            command_type=CommandType.HEALTH_CHECK,
-            timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
-            parameters={"include_details": True},
+        command = _CMD_ADAPTER.validate_python(
+            {
+                **_BASE_COMMAND,
+                "command_type": CommandType.HEALTH_CHECK,
+                "parameters": {"include_details": True},
+            }
         )
         
         assert command.command_type == CommandType.HEALTH_CHECK
@@ -206,10 +192,8 @@ class TestRemoteCommand:
 
     def test_get_metrics_command(self) -> None:
         """Test creating a get metrics command."""
-        command = RemoteCommand(
-            command_id="cmd-003",
-            command_type=CommandType.GET_METRICS,
-            timestamp=datetime.fromisoformat("2024-01-15T10:00:00+00:00"),
+        command = _CMD_ADAPTER.validate_python(
+            {**_BASE_COMMAND, "command_type": CommandType.GET_METRICS}
         )
         
         assert command.command_type == CommandType.GET_METRICS
@@ -219,3 +203,19 @@ class TestRemoteCommand:
         with pytest.raises(KeyError):
             # This should raise KeyError when trying to access invalid enum member
             CommandType["INVALID_COMMAND"]
+
+
+class TestValidate:
+    """Test cases for the shared model validator."""
+
+    def test_validate_uses_prebuilt_adapter(self) -> None:
+        """Test validating a queue payload through the shared adapters."""
+        record = validate(UsageRecord, _BASE_USAGE)
+        
+        assert isinstance(record, UsageRecord)
+        assert record.api_session_id == "test-session-001"
+
+    def test_validate_rejects_invalid_payload(self) -> None:
+        """Test validation errors propagate from the shared adapters."""
+        with pytest.raises(ValidationError):
+            validate(QuotaRefreshRequest, {**_BASE_QUOTA, "customer_id": None})
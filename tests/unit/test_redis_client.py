@@ -1,26 +1,52 @@
 """Unit tests for Redis client service."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+import weakref
+from datetime import timezone
+from typing import Iterator
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 import pytest_asyncio
+from pydantic import ValidationError
 
+from fakes import FakeRedis
 from models import RedisMessage
+from models.validation import _ADAPTERS
 from services.redis_client import RedisClient
 
+_TEST_DATA = {"test": "data"}
+_TEST_DATA_JSON = json.dumps(_TEST_DATA)
+
+_QUEUED_MESSAGE = {"message_type": "test", "data": {"test": "data"}}
+_QUEUED_MESSAGE_JSON = json.dumps(_QUEUED_MESSAGE)
+
+_BAD_MESSAGE = {"test": "data"}
+_BAD_MESSAGE_JSON = json.dumps(_BAD_MESSAGE)
+
+
+@pytest_asyncio.fixture(scope="class")
+async def shared_redis_client(mock_config) -> RedisClient:
+    """Build one Redis client per test class; tests reset it after use."""
+    return RedisClient(mock_config)
+
 
 class TestRedisClient:
     """Test cases for RedisClient class."""
 
-    @pytest_asyncio.fixture
-    async def redis_client(self, mock_config) -> RedisClient:
-        """Create a Redis client instance for testing."""
-        return RedisClient(mock_config)
+    @pytest.fixture
+    def redis_client(self, shared_redis_client) -> Iterator[RedisClient]:
+        """Hand out the shared client and drop its connection state afterwards."""
+        yield shared_redis_client
+        shared_redis_client._pool = None
+        shared_redis_client._client = None
+        shared_redis_client._connected = False
 
-    @pytest.mark.asyncio
-    async def test_connect_success(self, redis_client, mock_config) -> None:
+    async def test_connect_success(self, redis_client, mock_config, monkeypatch) -> None:
         """Test successful Redis connection."""
+        monkeypatch.setattr(RedisClient, "_pool_cache", weakref.WeakKeyDictionary())
         with patch("services.redis_client.redis") as mock_redis:
             mock_pool = AsyncMock()
             mock_client = AsyncMock()
@@ -43,9 +69,77 @@ class TestRedisClient:
             )
             mock_client.ping.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_connect_failure(self, redis_client) -> None:
+    async def test_connect_reuses_pool(self, mock_config, monkeypatch) -> None:
+        """Test that clients with the same settings share one connection pool."""
+        monkeypatch.setattr(RedisClient, "_pool_cache", weakref.WeakKeyDictionary())
+        with patch("services.redis_client.redis") as mock_redis:
+            mock_redis.Redis.return_value = AsyncMock()
+            
+            first = RedisClient(mock_config)
+            second = RedisClient(mock_config)
+            await first.connect()
+            await second.connect()
+            
+            mock_redis.ConnectionPool.assert_called_once()
+            assert first._pool is second._pool
+
+    async def test_disconnect_releases_pool(self, mock_config, monkeypatch) -> None:
+        """Test that disconnect closes the pool and evicts it from the loop's cache."""
+        monkeypatch.setattr(RedisClient, "_pool_cache", weakref.WeakKeyDictionary())
+        with patch("services.redis_client.redis") as mock_redis:
+            mock_redis.Redis.return_value = AsyncMock()
+            mock_redis.ConnectionPool.side_effect = lambda **kwargs: AsyncMock()
+            
+            client = RedisClient(mock_config)
+            await client.connect()
+            pool = client._pool
+            await client.disconnect()
+            
+            pool.disconnect.assert_awaited_once()
+            assert client._pool is None
+            assert RedisClient._pool_cache[asyncio.get_running_loop()] == {}
+            
+            # The next connect builds a fresh pool
+            await client.connect()
+            assert client._pool is not pool
+            assert mock_redis.ConnectionPool.call_count == 2
+
+    async def test_disconnect_keeps_shared_pool_open(self, mock_config, monkeypatch) -> None:
+        """Test that one client disconnecting leaves a pool it shares usable by the others."""
+        monkeypatch.setattr(RedisClient, "_pool_cache", weakref.WeakKeyDictionary())
+        
+        def client_for(connection_pool):
+            # Pings fail once the pool has been closed, as a real pool's would
+            async def ping():
+                if connection_pool.disconnect.await_count:
+                    raise ConnectionError("pool closed")
+                return True
+            
+            return AsyncMock(ping=AsyncMock(side_effect=ping))
+        
+        with patch("services.redis_client.redis") as mock_redis:
+            mock_redis.ConnectionPool.side_effect = lambda **kwargs: AsyncMock()
+            mock_redis.Redis.side_effect = client_for
+            
+            first = RedisClient(mock_config)
+            second = RedisClient(mock_config)
+            await first.connect()
+            await second.connect()
+            pool = second._pool
+            
+            await first.disconnect()
+            
+            pool.disconnect.assert_not_awaited()
+            assert await second.is_connected() is True
+            
+            await second.disconnect()
+            
+            pool.disconnect.assert_awaited_once()
+            assert RedisClient._pool_cache[asyncio.get_running_loop()] == {}
+
+    async def test_connect_failure(self, redis_client, monkeypatch) -> None:
         """Test Redis connection failure."""
+        monkeypatch.setattr(RedisClient, "_pool_cache", weakref.WeakKeyDictionary())
         with patch("services.redis_client.redis") as mock_redis:
             mock_client = AsyncMock()
             mock_client.ping = AsyncMock(side_effect=Exception("Connection failed"))
@@ -56,32 +150,28 @@ class TestRedisClient:
             
             assert redis_client._connected is False
 
-    @pytest.mark.asyncio
     async def test_disconnect(self, redis_client) -> None:
         """Test Redis disconnection."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis()
+        redis_client._client = fake
         redis_client._connected = True
         
         await redis_client.disconnect()
         
-        mock_client.close.assert_called_once()
+        assert fake.calls == [("close", (), {})]
         assert redis_client._connected is False
 
-    @pytest.mark.asyncio
     async def test_is_connected_true(self, redis_client) -> None:
         """Test is_connected returns True when connected."""
-        mock_client = AsyncMock()
-        mock_client.ping = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis(ping=True)
+        redis_client._client = fake
         redis_client._connected = True
         
         result = await redis_client.is_connected()
         
         assert result is True
-        mock_client.ping.assert_called_once()
+        assert fake.calls == [("ping", (), {})]
 
-    @pytest.mark.asyncio
     async def test_is_connected_false_when_not_connected(self, redis_client) -> None:
         """Test is_connected returns False when not connected."""
         redis_client._client = None
@@ -91,12 +181,9 @@ class TestRedisClient:
         
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_is_connected_false_on_ping_failure(self, redis_client) -> None:
         """Test is_connected returns False when ping fails."""
-        mock_client = AsyncMock()
-        mock_client.ping = AsyncMock(side_effect=Exception("Ping failed"))
-        redis_client._client = mock_client
+        redis_client._client = FakeRedis(ping=Exception("Ping failed"))
         redis_client._connected = True
         
         result = await redis_client.is_connected()
@@ -104,27 +191,25 @@ class TestRedisClient:
         assert result is False
         assert redis_client._connected is False
 
-    @pytest.mark.asyncio
     async def test_push_message_with_dict(self, redis_client) -> None:
         """Test pushing a dictionary message."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis()
+        redis_client._client = fake
         redis_client._connected = True
         
-        message = {"test": "data"}
         queue = "test_queue"
         
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
-            await redis_client.push_message(queue, message)
+            await redis_client.push_message(queue, _TEST_DATA)
             
-            expected_data = json.dumps(message, default=str)
-            mock_client.lpush.assert_called_once_with(queue, expected_data)
+            [(pushed_queue, payload)] = fake.pushed
+            assert pushed_queue == queue
+            assert orjson.loads(payload) == _TEST_DATA
 
-    @pytest.mark.asyncio
     async def test_push_message_with_redis_message(self, redis_client) -> None:
         """Test pushing a RedisMessage object."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis()
+        redis_client._client = fake
         redis_client._connected = True
         
         message = RedisMessage(
@@ -136,174 +221,272 @@ class TestRedisClient:
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             await redis_client.push_message(queue, message)
             
-            expected_data = json.dumps(message.model_dump(), default=str)
-            mock_client.lpush.assert_called_once_with(queue, expected_data)
+            [(pushed_queue, payload)] = fake.pushed
+            assert pushed_queue == queue
+            assert orjson.loads(payload) == {
+                "message_type": "test",
+                "timestamp": message.timestamp.replace(tzinfo=timezone.utc).isoformat(),
+                "data": {"test": "data"},
+                "correlation_id": None,
+            }
+
+    async def test_push_pop_round_trip(self, redis_client) -> None:
+        """Test that timestamps and non-string keys survive a push and pop."""
+        fake = FakeRedis()
+        redis_client._client = fake
+        redis_client._connected = True
+        
+        message = RedisMessage(message_type="test", data={"counts": {1: "one"}})
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            await redis_client.push_message("test_queue", message)
+            [(_, payload)] = fake.pushed
+            
+            redis_client._client = FakeRedis(rpop=payload)
+            popped = await redis_client.pop_message(
+                "test_queue", model_cls=RedisMessage
+            )
+            
+            # Naive UTC timestamps come back tagged with their offset
+            assert popped.timestamp == message.timestamp.replace(tzinfo=timezone.utc)
+            # Integer keys are written as strings, as json.dumps did
+            assert popped.data == {"counts": {"1": "one"}}
+
+    async def test_push_redis_message_reuses_encoding(self, redis_client) -> None:
+        """Test that re-pushing a RedisMessage reuses its cached encoding."""
+        fake = FakeRedis()
+        redis_client._client = fake
+        redis_client._connected = True
+        
+        message = RedisMessage(message_type="heartbeat", data={"test": "data"})
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            await redis_client.push_message("queue_a", message)
+            await redis_client.push_message("queue_b", message)
+            
+            [(_, first), (_, second)] = fake.pushed
+            assert first is second
+
+    async def test_push_redis_message_copy_is_reencoded(self, redis_client) -> None:
+        """Test that a model_copy of a pushed message does not reuse its encoding."""
+        fake = FakeRedis()
+        redis_client._client = fake
+        redis_client._connected = True
+        
+        message = RedisMessage(message_type="heartbeat", data={"test": "data"})
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            await redis_client.push_message("test_queue", message)
+            copied = message.model_copy(update={"correlation_id": "corr-123"})
+            await redis_client.push_message("test_queue", copied)
+            
+            [(_, first), (_, second)] = fake.pushed
+            assert orjson.loads(first)["correlation_id"] is None
+            assert orjson.loads(second)["correlation_id"] == "corr-123"
+
+    async def test_push_messages_batched(self, redis_client) -> None:
+        """Test pushing several messages with one variadic LPUSH."""
+        fake = FakeRedis()
+        redis_client._client = fake
+        redis_client._connected = True
+        
+        messages = [_TEST_DATA, _QUEUED_MESSAGE]
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            await redis_client.push_messages("test_queue", messages)
+            
+            [(pushed_queue, *payloads)] = fake.pushed
+            assert pushed_queue == "test_queue"
+            assert [orjson.loads(payload) for payload in payloads] == messages
 
-    @pytest.mark.asyncio
     async def test_pop_message_blocking(self, redis_client) -> None:
         """Test blocking pop message."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis(brpop=("queue", _QUEUED_MESSAGE_JSON))
+        redis_client._client = fake
         redis_client._connected = True
         
-        test_data = {"test": "data"}
-        mock_client.brpop = AsyncMock(return_value=("queue", json.dumps(test_data)))
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.pop_message("test_queue", timeout=10)
             
-            assert result == test_data
-            mock_client.brpop.assert_called_once_with(["test_queue"], timeout=10)
+            assert result == _QUEUED_MESSAGE
+            assert fake.calls == [("brpop", (["test_queue"],), {"timeout": 10})]
+            
+            # Trusted fast path builds the model without validating
+            message = await redis_client.pop_message(
+                "test_queue", timeout=10, model_cls=RedisMessage, validate=False
+            )
+            
+            assert isinstance(message, RedisMessage)
+            assert message.message_type == "test"
+            assert message.data == {"test": "data"}
 
-    @pytest.mark.asyncio
     async def test_pop_message_non_blocking(self, redis_client) -> None:
         """Test non-blocking pop message."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis(rpop=_QUEUED_MESSAGE_JSON)
+        redis_client._client = fake
         redis_client._connected = True
         
-        test_data = {"test": "data"}
-        mock_client.rpop = AsyncMock(return_value=json.dumps(test_data))
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.pop_message("test_queue", timeout=0)
             
-            assert result == test_data
-            mock_client.rpop.assert_called_once_with("test_queue")
+            assert result == _QUEUED_MESSAGE
+            assert fake.calls == [("rpop", ("test_queue",), {})]
+            
+            # Validation is on by default and parses the payload into the model
+            message = await redis_client.pop_message(
+                "test_queue", timeout=0, model_cls=RedisMessage
+            )
+            
+            assert isinstance(message, RedisMessage)
+            assert message.message_type == "test"
+            assert message.timestamp is not None
 
-    @pytest.mark.asyncio
     async def test_pop_message_empty_queue(self, redis_client) -> None:
         """Test pop message from empty queue."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        redis_client._client = FakeRedis(rpop=None)
         redis_client._connected = True
         
-        mock_client.rpop = AsyncMock(return_value=None)
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.pop_message("test_queue", timeout=0)
             
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_reliable_pop_message(self, redis_client) -> None:
         """Test reliable pop message using BRPOPLPUSH."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        redis_client._client = FakeRedis(brpoplpush=_TEST_DATA_JSON)
         redis_client._connected = True
         
-        test_data = {"test": "data"}
-        serialized_data = json.dumps(test_data)
-        
-        mock_client.brpoplpush = AsyncMock(return_value=serialized_data)
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.reliable_pop_message(
                 "source_queue", "processing_queue", timeout=5
             )
             
             assert result is not None
-            assert result == test_data
+            assert result == _TEST_DATA
+
+    async def test_pop_message_typed(self, redis_client) -> None:
+        """Test reliable pop validating into RedisMessage with the shared adapter."""
+        redis_client._client = FakeRedis(brpoplpush=_QUEUED_MESSAGE_JSON)
+        redis_client._connected = True
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            message = await redis_client.reliable_pop_message(
+                "source_queue", "processing_queue", model_cls=RedisMessage
+            )
+            
+            assert isinstance(message, RedisMessage)
+            assert message.data == {"test": "data"}
+            assert RedisMessage in _ADAPTERS
+
+    async def test_pop_message_rejects_invalid_by_default(self, redis_client) -> None:
+        """Test that a typed pop validates the payload unless told not to."""
+        redis_client._client = FakeRedis(rpop=_BAD_MESSAGE_JSON)
+        redis_client._connected = True
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            with pytest.raises(ValidationError):
+                await redis_client.pop_message("test_queue", model_cls=RedisMessage)
 
-    @pytest.mark.asyncio
     async def test_acknowledge_message(self, redis_client) -> None:
         """Test message acknowledgment."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis()
+        redis_client._client = fake
         redis_client._connected = True
         
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             await redis_client.acknowledge_message("processing_queue", "test_data")
             
-            mock_client.lrem.assert_called_once_with("processing_queue", 1, "test_data")
+            assert fake.calls == [("lrem", ("processing_queue", 1, "test_data"), {})]
 
-    @pytest.mark.asyncio
     async def test_move_to_dead_letter_queue(self, redis_client, mock_config) -> None:
         """Test moving message to dead letter queue."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis()
+        redis_client._client = fake
         redis_client._connected = True
         
-        original_message = {"test": "data"}
-        message_data = json.dumps(original_message)
         error_info = "Processing failed"
         
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             await redis_client.move_to_dead_letter_queue(
-                "processing_queue", message_data, error_info
+                "processing_queue", _BAD_MESSAGE_JSON, error_info
             )
             
             # Check that message was pushed to DLQ and removed from processing queue
-            assert mock_client.lpush.called
-            assert mock_client.lrem.called
+            [(dlq_queue, dlq_payload)] = fake.pushed
+            assert fake.calls_to("lrem")
             
             # Verify DLQ entry structure
-            dlq_call_args = mock_client.lpush.call_args[0]
-            assert dlq_call_args[0] == mock_config.dead_letter_queue
+            assert dlq_queue == mock_config.dead_letter_queue
             
-            dlq_entry = json.loads(dlq_call_args[1])
-            assert dlq_entry["original_message"] == original_message
+            dlq_entry = json.loads(dlq_payload)
+            assert dlq_entry["original_message"] == _BAD_MESSAGE
             assert dlq_entry["error_info"] == error_info
+            assert dlq_entry["processing_queue"] == "processing_queue"
+
+    async def test_move_malformed_message_to_dead_letter_queue(self, redis_client) -> None:
+        """Test that a payload that is not JSON is kept in the DLQ entry as a string."""
+        fake = FakeRedis()
+        redis_client._client = fake
+        redis_client._connected = True
+        
+        malformed = '{"test": "data"'
+        
+        with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
+            await redis_client.move_to_dead_letter_queue(
+                "processing_queue", malformed, "Invalid JSON"
+            )
+            
+            [(_, dlq_payload)] = fake.pushed
+            dlq_entry = json.loads(dlq_payload)
+            assert dlq_entry["original_message"] == malformed
+            assert dlq_entry["error_info"] == "Invalid JSON"
+            assert fake.calls_to("lrem") == [(("processing_queue", 1, malformed), {})]
 
-    @pytest.mark.asyncio
     async def test_get_queue_length(self, redis_client) -> None:
         """Test getting queue length."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis(llen=5)
+        redis_client._client = fake
         redis_client._connected = True
         
-        mock_client.llen = AsyncMock(return_value=5)
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.get_queue_length("test_queue")
             
             assert result == 5
-            mock_client.llen.assert_called_once_with("test_queue")
+            assert fake.calls == [("llen", ("test_queue",), {})]
 
-    @pytest.mark.asyncio
     async def test_set_cache(self, redis_client) -> None:
         """Test setting cache value."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis()
+        redis_client._client = fake
         redis_client._connected = True
         
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             await redis_client.set_cache("test_key", "test_value", ttl=60)
             
-            mock_client.setex.assert_called_once_with("test_key", 60, "test_value")
+            assert fake.calls == [("setex", ("test_key", 60, "test_value"), {})]
 
-    @pytest.mark.asyncio
     async def test_get_cache(self, redis_client) -> None:
         """Test getting cache value."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        fake = FakeRedis(get=b"test_value")
+        redis_client._client = fake
         redis_client._connected = True
         
-        mock_value = MagicMock()
-        mock_value.decode.return_value = "test_value"
-        mock_client.get = AsyncMock(return_value=mock_value)
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.get_cache("test_key")
             
             assert result == "test_value"
-            mock_client.get.assert_called_once_with("test_key")
+            assert fake.calls == [("get", ("test_key",), {})]
 
-    @pytest.mark.asyncio
     async def test_get_cache_not_found(self, redis_client) -> None:
         """Test getting cache value when key doesn't exist."""
-        mock_client = AsyncMock()
-        redis_client._client = mock_client
+        redis_client._client = FakeRedis(get=None)
         redis_client._connected = True
         
-        mock_client.get = AsyncMock(return_value=None)
-        
         with patch.object(redis_client, "_ensure_connected", new_callable=AsyncMock):
             result = await redis_client.get_cache("test_key")
             
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_health_check_healthy(self, redis_client, mock_config) -> None:
         """Test health check when Redis is healthy."""
         with patch.object(redis_client, "is_connected", return_value=True), \
@@ -322,7 +505,6 @@ class TestRedisClient:
             mock_get.assert_called_once()
             mock_delete.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_health_check_not_connected(self, redis_client) -> None:
         """Test health check when Redis is not connected."""
         with patch.object(redis_client, "is_connected", return_value=False):
@@ -331,7 +513,6 @@ class TestRedisClient:
             assert result["status"] == "unhealthy"
             assert "Not connected to Redis" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_health_check_cache_operations_fail(self, redis_client) -> None:
         """Test health check when cache operations fail."""
         with patch.object(redis_client, "is_connected", return_value=True), \
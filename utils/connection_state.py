@@ -1 +0,0 @@
-# This file is no longer used and has been intentionally left blank.
@@ -4,20 +4,58 @@ This module provides structured logging with support for both JSON and console o
 comprehensive context information, and proper error handling.
 """
 
+import functools
 import json
 import logging
 import os
+import secrets
+import socket
 import sys
 import threading
-import uuid
 from contextvars import ContextVar
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, cast
 
+import orjson
 import structlog
 
 # Context variable for correlation ID
 correlation_id_context: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
+# Process identity added to every record; the PID is refreshed in forked children
+_PID = os.getpid()
+try:
+    _HOSTNAME = os.uname().nodename
+except AttributeError:  # os.uname() is unavailable on Windows
+    _HOSTNAME = socket.gethostname()
+
+
+def _refresh_pid() -> None:
+    """Pick up the child's PID after a fork."""
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+# Insertion order; non-string keys are stringified like stdlib json does.
+# orjson output is always compact, so JSON records no longer have the spaces
+# json.dumps put after ":" and ",".
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any, default: Optional[Any] = None, **_: Any) -> str:
+    """Serialize a log record with orjson, as a ``json.dumps`` drop-in.
+
+    Records orjson cannot encode, such as integers wider than 64 bits, fall
+    back to the stdlib encoder rather than failing the log call.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=_JSON_OPTIONS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=default or str, separators=(",", ":"))
+
 
 def _log4j_formatter(logger: Any, name: str, event_dict: Dict[str, Any]) -> str:
     """Format logs in log4j style: timestamp [level]: message {json_context}"""
@@ -32,16 +70,29 @@ def _log4j_formatter(logger: Any, name: str, event_dict: Dict[str, Any]) -> str:
     # Format the log line
     if event_dict:
         # Convert remaining context to JSON
-        context_json = json.dumps(event_dict, sort_keys=True, separators=(',', ':'))
+        context_json = _dumps(event_dict)
         return f"{timestamp} [{level}]: {event} {context_json}"
     else:
         return f"{timestamp} [{level}]: {event}"
 
 
+_render_stack_info = structlog.processors.StackInfoRenderer()
+
+
+def _render_exc_and_stack(
+    logger: Any, name: str, event_dict: structlog.typing.EventDict
+) -> structlog.typing.EventDict:
+    """Render stack and exception info, skipping both for the common plain record."""
+    if "stack_info" in event_dict or "exc_info" in event_dict:
+        event_dict = _render_stack_info(logger, name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, name, event_dict)
+    return event_dict
+
+
 def _add_system_context(logger: Any, name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Add system context like process ID, thread ID, and hostname."""
-    event_dict["pid"] = os.getpid()
-    event_dict["hostname"] = os.uname().nodename
+    event_dict["pid"] = _PID
+    event_dict["hostname"] = _HOSTNAME
     
     # Add correlation ID if available
     correlation_id = correlation_id_context.get()
@@ -55,13 +106,14 @@ def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     """Set correlation ID for the current context.
     
     Args:
-        correlation_id: The correlation ID to set. If None, generates a new UUID.
+        correlation_id: The correlation ID to set. If None, generates a random
+            128-bit hex ID.
         
     Returns:
         The correlation ID that was set.
     """
     if correlation_id is None:
-        correlation_id = str(uuid.uuid4())
+        correlation_id = secrets.token_hex(16)
     
     correlation_id_context.set(correlation_id)
     return correlation_id
@@ -84,16 +136,23 @@ def configure_logging(log_level: str = "INFO", json_output: bool = True, include
         log_level: The minimum log level to output (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_output: If True, output pure JSON format. If False, use log4j-style format.
         include_system_context: If True, include system context like PID, hostname.
+
+    The level is fixed when this runs: loggers drop lower-level calls without
+    consulting the stdlib, so raising verbosity later through
+    ``logging.getLogger().setLevel()`` has no effect. Call this function
+    again to change it.
     """
     
     # Clear any existing handlers
     logging.getLogger().handlers.clear()
     
+    level = getattr(logging, log_level.upper())
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
         force=True,
     )
 
@@ -113,9 +172,11 @@ def configure_logging(log_level: str = "INFO", json_output: bool = True, include
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
+        # fmt="iso" already gets structlog's stamper that calls isoformat()
+        # directly, with no strftime, so there is nothing further to precompile.
+        # utc=False keeps the local-time timestamps the logs have always had.
         structlog.processors.TimeStamper(fmt="iso", utc=False),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_exc_and_stack,
     ]
     
     # Add system context if requested
@@ -127,22 +188,34 @@ def configure_logging(log_level: str = "INFO", json_output: bool = True, include
     
     if json_output:
         # Pure JSON output
-        processors.append(structlog.processors.JSONRenderer(sort_keys=True))
+        processors.append(structlog.processors.JSONRenderer(serializer=_dumps))
     else:
         # log4j-style output: timestamp [level]: message {json_context}
         processors.append(_log4j_formatter)
 
+    # Start from a clean slate and drop memoized loggers, which would otherwise
+    # keep the previous configuration's processors and level
+    structlog.reset_defaults()
+    _cached_logger.cache_clear()
+
     # Configure structlog
     structlog.configure(
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Methods below the configured level are no-ops that skip the processor chain
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str, **initial_context: Any) -> structlog.stdlib.BoundLogger:
+@functools.lru_cache(maxsize=256)
+def _cached_logger(name: str) -> structlog.typing.FilteringBoundLogger:
+    """Return the structlog logger for ``name``, created once per name."""
+    return cast(structlog.typing.FilteringBoundLogger, structlog.get_logger(name))
+
+
+def get_logger(name: str, **initial_context: Any) -> structlog.typing.FilteringBoundLogger:
     """Get a configured logger with optional initial context.
     
     Args:
@@ -152,13 +225,13 @@ def get_logger(name: str, **initial_context: Any) -> structlog.stdlib.BoundLogge
     Returns:
         A bound logger instance with the given name and context
     """
-    logger = structlog.get_logger(name)
+    logger = _cached_logger(name)
     if initial_context:
         logger = logger.bind(**initial_context)
     return logger
 
 
-def get_logger_for_class(cls_instance: Any, **initial_context: Any) -> structlog.stdlib.BoundLogger:
+def get_logger_for_class(cls_instance: Any, **initial_context: Any) -> structlog.typing.FilteringBoundLogger:
     """Get a logger for a class instance with class context.
     
     Args:
@@ -179,7 +252,7 @@ def get_logger_for_class(cls_instance: Any, **initial_context: Any) -> structlog
 
 
 class CorrelationIdFilter(logging.Filter):
-    """Filter to add correlation ID to log records."""
+    """Filter to add a fixed correlation ID to log records."""
 
     def __init__(self, correlation_id: Optional[str] = None) -> None:
         super().__init__()
@@ -196,7 +269,7 @@ def create_contextual_logger(
     name: str,
     correlation_id: Optional[str] = None,
     **context: Any
-) -> structlog.stdlib.BoundLogger:
+) -> structlog.typing.FilteringBoundLogger:
     """Create a logger with correlation ID and additional context.
     
     Args:
@@ -228,7 +301,7 @@ def create_contextual_logger(
 
 
 def log_exception(
-    logger: structlog.stdlib.BoundLogger,
+    logger: structlog.typing.FilteringBoundLogger,
     exception: Exception,
     message: str = "An error occurred",
     **additional_context: Any